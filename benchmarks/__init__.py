@@ -0,0 +1 @@
+"""Benchmarks for rangestr. Run each module with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,72 @@
+"""Compare ``BlockRanges`` with a flat ranges list on incremental updates.
+
+Each round reserves and releases small blocks of IDs at random in a list which already
+holds `size` ranges, like an allocator does.
+
+Usage: ``python -O -m benchmarks.bench_blocks [SIZE ...]``
+(``-O`` skips assertions in ``ranges``, which would dominate the list backend.)
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+from rangestr import ranges
+from rangestr.blocks import BlockRanges
+
+ROUNDS = 20000
+
+
+class ListRanges:
+    """The flat list backend with the same interface as ``BlockRanges``."""
+
+    def __init__(self, ranges_: List[Tuple[int, int]]) -> None:
+        self.ranges = list(ranges_)
+
+    def add(self, addition: Tuple[int, int]) -> None:
+        ranges.add(self.ranges, addition)
+
+    def subtract(self, subtraction: Tuple[int, int]) -> None:
+        ranges.subtract(self.ranges, subtraction)
+
+
+def make_operations(size: int, seed: int = 0) -> List[Tuple[bool, Tuple[int, int]]]:
+    rnd = random.Random(seed)
+    operations = []
+    for _ in range(ROUNDS):
+        lower = rnd.randrange(size * 4)
+        operations.append((rnd.random() < 0.5, (lower, lower + rnd.randrange(1, 3))))
+    return operations
+
+
+def run(
+    make: Callable[[], Any], operations: List[Tuple[bool, Tuple[int, int]]]
+) -> float:
+    container = make()
+    start = time.perf_counter()
+    for inclusive, r in operations:
+        if inclusive:
+            container.add(r)
+        else:
+            container.subtract(r)
+    return time.perf_counter() - start
+
+
+def main(*sizes: int) -> None:
+    if __debug__:
+        print("warning: assertions are enabled; run with `python -O`", file=sys.stderr)
+    for size in sizes or (10**3, 10**4, 10**5, 10**6):
+        # every other pair of integers is included
+        initial = [(i * 4, i * 4 + 2) for i in range(size)]
+        operations = make_operations(size)
+        for name, make in (
+            ("list", lambda: ListRanges(initial)),
+            ("blocks", lambda: BlockRanges._from_sorted(initial)),
+        ):
+            elapsed = run(make, operations)
+            print(f"{size:>8} ranges {name:>7}: {elapsed / ROUNDS * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Compare the single-pass scanner with the split/strip/find/int tokenizing.
+
+Usage: ``python -m benchmarks.bench_scanner [SIZE_IN_BYTES]``
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List
+
+from rangestr import parsers, scanner
+
+
+def make_source(size: int, seed: int = 0) -> str:
+    """Make a selector string of approximately `size` characters."""
+    rnd = random.Random(seed)
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        lower = rnd.randrange(10**7)
+        part = (
+            f"{'^' if rnd.random() < 0.3 else ''}{lower}-{lower + rnd.randrange(100)}"
+        )
+        parts.append(part)
+        length += len(part) + 2
+    return ", ".join(parts)
+
+
+def legacy_tokenize(src: str, delimiter: str) -> list:
+    """The tokenizing which ``parsers.parse_ranges`` used to do."""
+    return [
+        parsers.parse_single_range(single_range, delimiter)
+        for single_range in filter(bool, map(lambda e: e.strip(), src.split(",")))
+    ]
+
+
+def scan_tokenize(src: str, delimiter: str) -> list:
+    return list(scanner.scan(src, delimiter))
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Return the best wall time of `repeat` calls in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(size: int = 1 << 20) -> None:
+    src = make_source(size)
+    print(f"source: {len(src)} chars, {src.count(',') + 1} ranges")
+    for name, tokenize in (("split", legacy_tokenize), ("scan", scan_tokenize)):
+        elapsed = best_of(lambda: tokenize(src, "-"))
+        print(f"{name:>8}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
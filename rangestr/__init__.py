@@ -1,9 +1,15 @@
 """A Python package for generating ranges of integers from a string."""
-from itertools import chain as _chain
 from typing import Optional, Iterator
 
 from . import _version
+from . import compiled
 from . import parsers
+from .arrays import to_numpy, contains_many, select_many
+from .buffers import iter_chunks
+from .compiled import Expression, ExpressionCache
+from .formatters import format_integers
+from .rangeset import RangeSet
+from .streaming import parse_stream
 
 __author__ = "Keyfox"
 __version__ = _version.version
@@ -15,16 +21,36 @@ def rangestr(
     upper: Optional[int] = None,
     delimiter: str = parsers.DEFAULT_DELIMITER,
     implicit_inclusion: bool = False,
+    engine: str = parsers.DEFAULT_ENGINE,
 ) -> Iterator[int]:
     """Return an iterator which iterates through integers represented in the given string.
 
+    Parsed strings are kept in ``compiled.default_cache``, so repeated strings are
+    parsed only once. It can be resized or disabled by ``default_cache.resize()``.
+
     :param src: A string to be parsed.
     :param lower: Inclusive lower endpoint of the entire range.
     :param upper: Inclusive upper endpoint of the entire range.
     :param delimiter: A delimiter of endpoints. Defaults to a dash (``-``).
     :param implicit_inclusion: Whether to include all integers when an exclusion range
            comes in first.
+    :param engine: The name of an evaluation engine. See ``parsers.parse_ranges``.
     :return: An iterator of integers which are represented in `src`.
     """
-    ranges = parsers.parse_ranges(src, lower, upper, delimiter, implicit_inclusion)
-    return _chain.from_iterable(map(lambda r: range(*r), ranges))
+    expression = compiled.default_cache.get(src, delimiter)
+    return expression(lower, upper, implicit_inclusion, engine)
+
+
+def compile(src: str, delimiter: str = parsers.DEFAULT_DELIMITER) -> Expression:
+    """Parse the given string into an expression which can be evaluated many times.
+
+    >>> expression = compile("1-3, 8-")
+    >>> list(expression(upper=10))
+    [1, 2, 3, 8, 9, 10]
+
+    :param src: A string to be parsed.
+    :param delimiter: A delimiter of endpoints. Defaults to a dash (``-``).
+    :return: A compiled expression; call it with `lower`, `upper` and
+             `implicit_inclusion` just like ``rangestr``.
+    """
+    return Expression(src, delimiter)
@@ -0,0 +1,157 @@
+"""NumPy integration. NumPy is an optional dependency; install it to use this module.
+
+Functions which have a pure-Python fallback say so in their docstrings.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from . import compiled
+from . import parsers
+from . import ranges
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required; install it with `pip install numpy`")
+
+
+def ranges_to_numpy(
+    ranges_: Iterable[ranges.Endpoints],
+    dtype: Any = "int64",
+    out: "Optional[np.ndarray]" = None,
+) -> "np.ndarray":
+    """Materialize integers in ranges as an array in one vectorized step.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param dtype: The data type of the array. Ignored when `out` is given.
+    :param out: A preallocated 1-D array to write into. It must be at least as long as
+           the number of integers.
+    :return: An array of integers; a view of the head of `out` if it's given.
+    """
+    _require_numpy()
+    bounds = np.array(list(ranges_), dtype=np.int64).reshape(-1, 2)
+    lowers, uppers = bounds[:, 0], bounds[:, 1]
+    lengths = uppers - lowers
+    total = int(lengths.sum())
+
+    if out is None:
+        result = np.empty(total, dtype=dtype)
+    else:
+        if out.ndim != 1 or len(out) < total:
+            raise ValueError(f"`out` must be a 1-D array of at least {total} elements")
+        result = out[:total]
+    if total == 0:
+        return result
+
+    # Fill with 1 and put the difference from the previous integer at the head of each
+    # range, so that the cumulative sum makes the integers.
+    result.fill(1)
+    starts = np.cumsum(lengths) - lengths
+    result[starts[0]] = lowers[0]
+    result[starts[1:]] = lowers[1:] - uppers[:-1] + 1
+    np.cumsum(result, out=result)
+    return result
+
+
+def to_numpy(
+    src: str,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    implicit_inclusion: bool = False,
+    dtype: Any = "int64",
+    out: "Optional[np.ndarray]" = None,
+) -> "np.ndarray":
+    """Return an array of integers represented in the given string.
+
+    See ``rangestr.rangestr`` for `src`, `lower`, `upper`, `delimiter` and
+    `implicit_inclusion`, and ``ranges_to_numpy`` for `dtype` and `out`.
+    """
+    return ranges_to_numpy(
+        compiled.default_cache.get(src, delimiter).ranges(
+            lower, upper, implicit_inclusion
+        ),
+        dtype=dtype,
+        out=out,
+    )
+
+
+def _flatten(ranges_: Iterable[ranges.Endpoints]) -> "array[int]":
+    """Flatten ranges into a sorted boundary buffer, ``[lower0, upper0, ...]``."""
+    bounds = array("q")
+    for r in ranges_:
+        bounds.extend(r)
+    return bounds
+
+
+def _contains_bounds(
+    bounds: Sequence[int], values: Any
+) -> "Union[np.ndarray, List[bool]]":
+    """``contains_many`` for a sorted boundary buffer.
+
+    An integer is contained if and only if the number of boundaries less than or equal
+    to it is odd.
+    """
+    if np is not None:
+        index = np.searchsorted(
+            (
+                np.frombuffer(bounds, dtype=np.int64)
+                if isinstance(bounds, array)
+                else np.asarray(bounds, dtype=np.int64)
+            ),
+            np.asarray(values),
+            side="right",
+        )
+        return (index & 1).astype(bool)
+    if not hasattr(values, "__iter__"):
+        values = memoryview(values)
+    return [bisect_right(bounds, v) & 1 == 1 for v in values]
+
+
+def contains_many(
+    ranges_: Iterable[ranges.Endpoints], values: Any
+) -> "Union[np.ndarray, List[bool]]":
+    """Test if each of values is contained in ranges, in a single vectorized pass.
+
+    It falls back on bisecting each value when NumPy is not installed.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param values: A NumPy array, ``array.array``, an object which supports the buffer
+           protocol, or any iterable of integers.
+    :return: A boolean NumPy array, or a list of booleans without NumPy.
+    """
+    return _contains_bounds(_flatten(ranges_), values)
+
+
+def _select_bounds(
+    bounds: Sequence[int], values: Any
+) -> "Union[np.ndarray, List[int]]":
+    """``select_many`` for a sorted boundary buffer."""
+    if np is not None:
+        values = np.asarray(values)
+        return values[_contains_bounds(bounds, values)]
+    if not hasattr(values, "__iter__"):
+        values = memoryview(values)
+    return [v for v in values if bisect_right(bounds, v) & 1]
+
+
+def select_many(
+    ranges_: Iterable[ranges.Endpoints], values: Any
+) -> "Union[np.ndarray, List[int]]":
+    """Filter values which are contained in ranges, in a single vectorized pass.
+
+    It falls back on bisecting each value when NumPy is not installed.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param values: A NumPy array, ``array.array``, an object which supports the buffer
+           protocol, or any iterable of integers.
+    :return: A NumPy array, or a list of integers without NumPy.
+    """
+    return _select_bounds(_flatten(ranges_), values)
@@ -0,0 +1,233 @@
+"""A ranges list stored in bounded-size blocks.
+
+A flat ranges list takes O(n) time to insert or delete a range because the rest of the
+list has to be moved. ``BlockRanges`` splits ranges into a list of blocks, each of which
+holds at most ``2 * load`` ranges, and keeps the upper endpoint of the last range in
+each block to find a block by bisection. An update moves only ranges in a block, taking
+O(log n + load) time apart from deleting blocks entirely covered by a range.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from . import ranges
+
+DEFAULT_LOAD = 512
+
+# a position of a range: a tuple of an index of a block and an index in the block
+_Position = Tuple[int, int]
+
+_INFINITY = float("inf")
+
+
+class BlockRanges:
+    """A mutable ranges list which supports the same operations as ``ranges``."""
+
+    __slots__ = ("_blocks", "_maxes", "_load", "_count")
+
+    def __init__(
+        self, ranges_: Iterable[ranges.Endpoints] = (), load: int = DEFAULT_LOAD
+    ) -> None:
+        """
+        :param ranges_: Ranges to be added. They may overlap each other and don't have
+               to be sorted.
+        :param load: A block is split when it holds more than ``2 * load`` ranges.
+        """
+        if load < 2:
+            raise ValueError("`load` must be 2 or more")
+        self._blocks: List[ranges.Ranges] = []
+        self._maxes: List[int] = []
+        self._load = load
+        self._count = 0
+        for r in ranges_:
+            self.add(r)
+
+    @classmethod
+    def _from_sorted(
+        cls, ranges_: ranges.Ranges, load: int = DEFAULT_LOAD
+    ) -> "BlockRanges":
+        """Make ranges from a list which is already sorted and disjoint."""
+        self = cls(load=load)
+        self._blocks = [ranges_[i : i + load] for i in range(0, len(ranges_), load)]
+        self._maxes = [block[-1][1] for block in self._blocks]
+        self._count = len(ranges_)
+        return self
+
+    def __len__(self) -> int:
+        """Return the number of ranges."""
+        return self._count
+
+    def __iter__(self) -> Iterator[ranges.Endpoints]:
+        for block in self._blocks:
+            yield from block
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_list()!r})"
+
+    def to_list(self) -> ranges.Ranges:
+        """Return ranges as a flat list."""
+        return [r for block in self._blocks for r in block]
+
+    def _normalize(self, bi: int, i: int) -> _Position:
+        """Move a position at the end of a block to the head of the next block."""
+        if i == len(self._blocks[bi]) and bi + 1 < len(self._blocks):
+            return bi + 1, 0
+        return bi, i
+
+    def _end(self) -> _Position:
+        return len(self._blocks) - 1, len(self._blocks[-1])
+
+    def _locate_upper(self, n: Union[int, float], strict: bool) -> _Position:
+        """Locate the first range whose upper endpoint is greater than or equal to
+        (or greater than, if `strict`) `n`."""
+        bi = (bisect_right if strict else bisect_left)(self._maxes, n)
+        if bi == len(self._blocks):
+            return self._end()
+        block = self._blocks[bi]
+        # the first range whose lower endpoint is greater than (or equal to) `n`,
+        # or the range just before it if it involves `n`
+        i = bisect_right(block, (n, _INFINITY)) if strict else bisect_left(block, (n,))
+        if i > 0 and (block[i - 1][1] > n if strict else block[i - 1][1] >= n):
+            i -= 1
+        return bi, i
+
+    def _locate_lower(self, n: Union[int, float], strict: bool) -> _Position:
+        """Locate the position just after the last range whose lower endpoint is less
+        than or equal to (or less than, if `strict`) `n`."""
+        # ranges in the following blocks start after the block's max which is >= n
+        bi = bisect_left(self._maxes, n)
+        if bi == len(self._blocks):
+            return self._end()
+        block = self._blocks[bi]
+        i = bisect_left(block, (n,)) if strict else bisect_right(block, (n, _INFINITY))
+        return self._normalize(bi, i)
+
+    def _at(self, position: _Position) -> ranges.Endpoints:
+        bi, i = position
+        return self._blocks[bi][i]
+
+    def _before(self, position: _Position) -> ranges.Endpoints:
+        """Return the range just before the position."""
+        bi, i = position
+        return self._blocks[bi][i - 1] if i > 0 else self._blocks[bi - 1][-1]
+
+    def _replace(
+        self, start: _Position, end: _Position, additions: List[ranges.Endpoints]
+    ) -> None:
+        """Replace ranges from `start` to `end` (exclusive) with `additions`.
+
+        :param start: A position of the first range to be removed.
+        :param end: A position just after the last range to be removed.
+        :param additions: Ranges to be put instead.
+        """
+        (bi, i), (bj, j) = start, end
+        blocks = self._blocks
+        if bi == bj:
+            block = blocks[bi]
+            self._count += len(additions) - (j - i)
+            block[i:j] = additions
+        else:
+            removed = len(blocks[bi]) - i + j
+            removed += sum(len(b) for b in blocks[bi + 1 : bj])
+            self._count += len(additions) - removed
+            blocks[bi][i:] = additions
+            del blocks[bj][:j]
+            # blocks entirely covered are dropped at once
+            del blocks[bi + 1 : bj]
+            del self._maxes[bi + 1 : bj]
+            self._rebalance(bi + 1)
+        self._rebalance(bi)
+
+    def _rebalance(self, bi: int) -> None:
+        """Keep the size of a block within bounds, and update its max."""
+        blocks, maxes = self._blocks, self._maxes
+        if bi >= len(blocks):
+            return
+        block = blocks[bi]
+        if not block:
+            del blocks[bi]
+            del maxes[bi]
+            return
+        if len(block) < self._load // 2 and bi + 1 < len(blocks):
+            # merge a small block into the next one
+            block.extend(blocks[bi + 1])
+            del blocks[bi + 1]
+            del maxes[bi + 1]
+        if len(block) > self._load * 2:
+            half = len(block) // 2
+            blocks.insert(bi + 1, block[half:])
+            maxes.insert(bi + 1, block[-1][1])
+            del block[half:]
+        maxes[bi] = block[-1][1]
+
+    def add(self, addition: ranges.Endpoints) -> None:
+        """Add a range. See ``ranges.add``.
+
+        :param addition: A range to be added.
+        """
+        lower, upper = addition
+        if lower >= upper:
+            return
+        if not self._blocks:
+            self._blocks.append([addition])
+            self._maxes.append(upper)
+            self._count = 1
+            return
+        # ranges which are involved in or adjacent to the addition are to be linked
+        start = self._locate_upper(lower, strict=False)
+        end = self._locate_lower(upper, strict=False)
+        if start < end:
+            lower = min(lower, self._at(start)[0])
+            upper = max(upper, self._before(end)[1])
+        else:
+            end = start
+        self._replace(start, end, [(lower, upper)])
+
+    def subtract(self, subtraction: ranges.Endpoints) -> None:
+        """Subtract a range. See ``ranges.subtract``.
+
+        :param subtraction: A range to be removed.
+        """
+        lower, upper = subtraction
+        if not self._blocks or lower >= upper:
+            return
+        # ranges which overlap the subtraction are to be cut
+        start = self._locate_upper(lower, strict=True)
+        end = self._locate_lower(upper, strict=True)
+        if not start < end:
+            return
+        first, last = self._at(start), self._before(end)
+        self._replace(
+            start,
+            end,
+            [r for r in ((first[0], lower), (upper, last[1])) if r[0] < r[1]],
+        )
+
+    def crop(self, lower: Union[int, None], upper: Union[int, None]) -> None:
+        """Crop ranges to fit the given endpoints. See ``ranges.crop``.
+
+        :param lower: The *inclusive* lower endpoint.
+        :param upper: The *exclusive* upper endpoint.
+        """
+        if lower is not None and self._blocks:
+            first = self._blocks[0][0][0]
+            if first < lower:
+                self.subtract((first, lower))
+        if upper is not None and self._blocks:
+            last = self._maxes[-1]
+            if upper < last:
+                self.subtract((upper, last))
+
+    def find_index(self, n: int) -> Tuple[bool, int]:
+        """Search for the range which involves `n`. See ``ranges.find_index``.
+
+        :param n: An integer to be searched for.
+        :return: A 2-tuple; a boolean which indicates whether a range which involves
+                 `n` exists, and an index of the (perhaps nearest) range.
+        """
+        if not self._blocks:
+            return False, 0
+        bi, i = self._locate_upper(n, strict=False)
+        block = self._blocks[bi]
+        found = i < len(block) and block[i][0] <= n
+        return found, sum(len(b) for b in self._blocks[:bi]) + i
@@ -0,0 +1,91 @@
+from array import array
+from typing import Iterable, Iterator, Optional
+
+from . import compiled
+from . import parsers
+from . import ranges
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def iter_range_chunks(
+    ranges_: Iterable[ranges.Endpoints],
+    size: int = DEFAULT_CHUNK_SIZE,
+    reverse: bool = False,
+    step: int = 1,
+    reuse: bool = True,
+) -> Iterator[memoryview]:
+    """Iterate through integers in ranges in batches of contiguous int64 buffers.
+
+    Buffers are filled from the endpoints of ranges at C speed without creating a
+    Python ``int`` for each integer, and can be written to files or sockets as is.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param size: The number of integers in a batch. Only the last batch may be shorter.
+    :param reverse: Whether to iterate in descending order.
+    :param step: Take every `step`-th integer, counted across ranges.
+    :param reuse: Whether to fill the same buffer for every batch. If True, a batch is
+           overwritten by the next one, thus it must be consumed (or copied) before
+           iterating further.
+    :return: An iterator of ``memoryview`` of format ``q``.
+    """
+    if size < 1:
+        raise ValueError("`size` must be 1 or more")
+    if step < 1:
+        raise ValueError("`step` must be 1 or more")
+
+    buffer = array("q", bytes(size * 8))
+    view = memoryview(buffer)
+    filled = 0
+    # the number of integers to skip at the head of the next range to keep the stride
+    skip = 0
+    for lower, upper in reversed(list(ranges_)) if reverse else ranges_:
+        if reverse:
+            integers = range(upper - 1 - skip, lower - 1, -step)
+        else:
+            integers = range(lower + skip, upper, step)
+        if not integers:
+            skip -= upper - lower
+            continue
+        skip = (
+            lower - integers[-1] + step - 1 if reverse else integers[-1] + step - upper
+        )
+
+        position = 0
+        while position < len(integers):
+            count = min(len(integers) - position, size - filled)
+            buffer[filled : filled + count] = array(
+                "q", integers[position : position + count]
+            )
+            filled += count
+            position += count
+            if filled == size:
+                yield view
+                filled = 0
+                if not reuse:
+                    buffer = array("q", bytes(size * 8))
+                    view = memoryview(buffer)
+    if filled:
+        yield view[:filled]
+
+
+def iter_chunks(
+    src: str,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    implicit_inclusion: bool = False,
+    size: int = DEFAULT_CHUNK_SIZE,
+    reverse: bool = False,
+    step: int = 1,
+    reuse: bool = True,
+) -> Iterator[memoryview]:
+    """Iterate through integers represented in the given string in batches.
+
+    See ``rangestr.rangestr`` for `src`, `lower`, `upper`, `delimiter` and
+    `implicit_inclusion`, and ``iter_range_chunks`` for the rest.
+    """
+    ranges_ = compiled.default_cache.get(src, delimiter).ranges(
+        lower, upper, implicit_inclusion
+    )
+    return iter_range_chunks(ranges_, size, reverse, step, reuse)
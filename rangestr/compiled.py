@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from itertools import chain as _chain
+from threading import Lock
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from . import parsers
+from . import ranges
+from . import scanner
+
+DEFAULT_CACHE_SIZE = 256
+# sources longer than this won't be cached by default to keep the cache small
+DEFAULT_CACHE_MAX_LENGTH = 4096
+
+
+class Expression:
+    """A parsed expression which can be evaluated against many universes.
+
+    Tokenizing is done only once on construction, and each evaluation starts from the
+    parsed ranges.
+    """
+
+    __slots__ = ("src", "delimiter", "_terms")
+
+    def __init__(self, src: str, delimiter: str = parsers.DEFAULT_DELIMITER) -> None:
+        """
+        :param src: A string to be parsed.
+        :param delimiter: A delimiter of endpoints.
+        """
+        self.src = src
+        self.delimiter = delimiter
+        self._terms: Tuple[scanner.Token, ...] = tuple(
+            parsers.parse_terms(src, delimiter)
+        )
+
+    def ranges(
+        self,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        implicit_inclusion: bool = False,
+        engine: str = parsers.DEFAULT_ENGINE,
+    ) -> ranges.Ranges:
+        """Evaluate the expression into ranges, like ``parsers.parse_ranges``.
+
+        :param lower: Inclusive lower endpoint of the entire range.
+        :param upper: Inclusive upper endpoint of the entire range.
+        :param implicit_inclusion: Whether to include all integers when an exclusion
+               range comes in first.
+        :param engine: The name of an evaluation engine.
+        :return: A list of tuples which represents a range in *open-closed* form.
+        """
+        return parsers.get_engine(engine)(
+            parsers.resolve_terms(
+                self._terms, lower, upper, self.delimiter, implicit_inclusion
+            )
+        )
+
+    def __call__(
+        self,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        implicit_inclusion: bool = False,
+        engine: str = parsers.DEFAULT_ENGINE,
+    ) -> Iterator[int]:
+        """Evaluate the expression into integers, like ``rangestr.rangestr``.
+
+        See ``Expression.ranges`` for the arguments.
+        """
+        return _chain.from_iterable(
+            map(
+                lambda r: range(*r),
+                self.ranges(lower, upper, implicit_inclusion, engine),
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.src!r}, delimiter={self.delimiter!r})"
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of ``ExpressionCache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class ExpressionCache:
+    """A thread-safe LRU cache of compiled expressions keyed by source strings."""
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = DEFAULT_CACHE_SIZE,
+        max_length: Optional[int] = DEFAULT_CACHE_MAX_LENGTH,
+    ) -> None:
+        """
+        :param maxsize: The maximum number of expressions to be kept. The least
+               recently used expression is evicted when exceeded.
+               None means unbounded, and 0 disables caching.
+        :param max_length: Sources longer than this are compiled but never cached.
+               None means any source can be cached.
+        """
+        self._entries: "OrderedDict[Tuple[str, str], Expression]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.maxsize = maxsize
+        self.max_length = max_length
+
+    def get(self, src: str, delimiter: str = parsers.DEFAULT_DELIMITER) -> Expression:
+        """Return a compiled expression for the source, compiling it on a miss.
+
+        :param src: A string to be parsed.
+        :param delimiter: A delimiter of endpoints.
+        :return: A compiled expression.
+        """
+        key = (src, delimiter)
+        with self._lock:
+            expression = self._entries.get(key)
+            if expression is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return expression
+            self._misses += 1
+
+        # compile outside of the lock; errors propagate without being cached
+        expression = Expression(src, delimiter)
+        if self.maxsize == 0 or (
+            self.max_length is not None and len(src) > self.max_length
+        ):
+            return expression
+
+        with self._lock:
+            self._entries[key] = expression
+            self._evict()
+        return expression
+
+    def _evict(self) -> None:
+        """Evict least recently used expressions to fit `maxsize`."""
+        if self.maxsize is None:
+            return
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """Change the maximum number of expressions, evicting ones if needed.
+
+        :param maxsize: The new maximum number of expressions.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all expressions and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# the cache used by ``rangestr.rangestr``
+default_cache = ExpressionCache()
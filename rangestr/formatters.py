@@ -0,0 +1,170 @@
+"""The inverse of parsing: turn integers back into a string of ranges."""
+
+from typing import Iterable, Iterator, List, Optional
+
+from . import parsers
+from . import ranges
+
+DEFAULT_SEPARATOR = ", "
+
+
+def compress(
+    values: Iterable[int], assume_sorted: bool = True
+) -> Iterator[ranges.Endpoints]:
+    """Merge integers into sorted and disjoint ranges.
+
+    Sorted input is consumed lazily in O(1) extra memory. Duplicates are allowed.
+
+    :param values: Integers to be merged.
+    :param assume_sorted: Whether `values` is sorted in ascending order. If False, it's
+           sorted beforehand, which takes O(n) memory.
+    :return: An iterator of ranges, as returned by ``parsers.parse_ranges``.
+    """
+    if not assume_sorted:
+        values = sorted(set(values))
+    it = iter(values)
+    for first in it:
+        lower = upper = first
+        break
+    else:
+        return
+    for n in it:
+        if n == upper or n == upper + 1:
+            upper = n
+        elif n > upper:
+            yield lower, upper + 1
+            lower = upper = n
+        else:
+            raise ValueError(f"Integers are not sorted: {n} comes after {upper}")
+    yield lower, upper + 1
+
+
+def _format_endpoint(n: int, delimiter: str) -> str:
+    if n < 0 and delimiter[0] == "-":
+        raise ValueError(
+            f"Negative integer {n} can't be formatted with delimiter {delimiter!r}"
+        )
+    return str(n)
+
+
+def _format_range(
+    r: ranges.Endpoints,
+    delimiter: str,
+    lower: Optional[int],
+    upper: Optional[int],
+) -> str:
+    """Format a range, omitting endpoints which are equal to the universe ones."""
+    range_lower, range_upper = r[0], r[1] - 1
+    if range_lower == range_upper:
+        return _format_endpoint(range_lower, delimiter)
+    if range_lower == lower:
+        return delimiter + _format_endpoint(range_upper, delimiter)
+    if range_upper == upper:
+        return _format_endpoint(range_lower, delimiter) + delimiter
+    return (
+        _format_endpoint(range_lower, delimiter)
+        + delimiter
+        + _format_endpoint(range_upper, delimiter)
+    )
+
+
+def iter_terms(
+    ranges_: Iterable[ranges.Endpoints],
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+) -> Iterator[str]:
+    """Format ranges into terms one by one, so that they can be written out lazily.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param delimiter: A delimiter of endpoints.
+    :param lower: Inclusive lower endpoint of the entire range. A range which starts
+           from it is formatted with the lower endpoint omitted, e.g. ``-5``.
+    :param upper: Inclusive upper endpoint of the entire range. A range which ends
+           with it is formatted with the upper endpoint omitted, e.g. ``5-``.
+    :return: An iterator of terms, without separators.
+    """
+    for r in ranges_:
+        yield _format_range(r, delimiter, lower, upper)
+
+
+def _complement(
+    ranges_: ranges.Ranges, lower: int, upper: int
+) -> List[ranges.Endpoints]:
+    """Return gaps between ranges within the universe ``[lower, upper)``."""
+    bounds = [lower] + [n for r in ranges_ for n in r] + [upper]
+    return [(l, u) for l, u in zip(bounds[::2], bounds[1::2]) if l < u]
+
+
+def format_ranges(
+    ranges_: Iterable[ranges.Endpoints],
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+    exclusions: bool = False,
+    separator: str = DEFAULT_SEPARATOR,
+) -> str:
+    """Format ranges into a canonical string which ``parsers.parse_ranges`` accepts.
+
+    Parsing the result with the same `delimiter`, `lower` and `upper` gives the same
+    ranges, cropped to the universe if it's given.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param delimiter: A delimiter of endpoints. Negative integers can't be formatted
+           if it starts with ``-``.
+    :param lower: Inclusive lower endpoint of the entire range.
+    :param upper: Inclusive upper endpoint of the entire range.
+    :param exclusions: Whether to exclude gaps from the entire range instead, e.g.
+           ``1-100, ^50``, when it makes the string shorter. Requires both `lower` and
+           `upper`, and ranges are held in memory to compare both forms.
+    :param separator: A string to join terms with. It must contain a comma.
+    :return: A string of ranges.
+    """
+    if "," not in separator:
+        raise ValueError(f"Invalid separator: {separator!r}")
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError("`lower` must be less than or equal to `upper`")
+    if lower is not None or upper is not None:
+        ranges_ = list(ranges_)
+        ranges.crop(ranges_, lower, None if upper is None else upper + 1)
+    if not exclusions:
+        return separator.join(iter_terms(ranges_, delimiter, lower, upper))
+
+    if lower is None or upper is None:
+        raise ValueError("Both `lower` and `upper` are required for exclusions")
+    assert isinstance(ranges_, list)
+    inclusive = separator.join(iter_terms(ranges_, delimiter, lower, upper))
+    gaps = _complement(ranges_, lower, upper + 1)
+    try:
+        exclusive = separator.join(
+            [_format_range((lower, upper + 1), delimiter, None, None)]
+            + ["^" + term for term in iter_terms(gaps, delimiter, lower, upper)]
+        )
+    except ValueError:
+        # the universe has a negative endpoint which can't be formatted
+        return inclusive
+    return exclusive if len(exclusive) < len(inclusive) else inclusive
+
+
+def format_integers(
+    values: Iterable[int],
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+    exclusions: bool = False,
+    assume_sorted: bool = True,
+) -> str:
+    """Format integers into the shortest canonical string of ranges.
+
+    This is the inverse of ``rangestr.rangestr``;
+    ``format_integers(rangestr(src, ...), ...)`` represents the same integers as `src`.
+
+    :param values: Integers to be formatted.
+    :param assume_sorted: Whether `values` is sorted in ascending order.
+    :return: A string of ranges.
+
+    See ``format_ranges`` for the other arguments.
+    """
+    return format_ranges(
+        compress(values, assume_sorted), delimiter, lower, upper, exclusions
+    )
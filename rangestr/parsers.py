@@ -1,9 +1,17 @@
-from typing import Tuple, Union, Iterable, List, Any
+from typing import Tuple, Union, Iterable, Iterator, List, Any, Optional, Callable, Dict
 
 from . import ranges
+from . import scanner
+from . import sweep
 
 ParsedRange = Union[ranges.Endpoints, Tuple[None, int], Tuple[int, None]]
+# A range operation which is resolved against the universe: a tuple of a boolean which
+# indicates whether the range is to be included, an *inclusive* lower endpoint and an
+# *exclusive* upper endpoint. An endpoint is None when the range is unbounded on the
+# side, which happens only for exclusive ranges.
+Operation = Tuple[bool, Optional[int], Optional[int]]
 DEFAULT_DELIMITER = "-"
+DEFAULT_ENGINE = "incremental"
 
 
 def parse_endpoints(src: str, delimiter: str) -> ParsedRange:
@@ -50,6 +58,17 @@ def parse_single_range(src: str, delimiter: str) -> Tuple[bool, ParsedRange]:
     )
 
 
+def parse_terms(src: str, delimiter: str) -> Iterator[scanner.Token]:
+    """Parse comma-separated ranges, without applying them.
+
+    :param src: A string to be parsed.
+    :param delimiter: A delimiter of endpoints.
+    :return: An iterator of tuples of a boolean which indicates whether the range is
+             inclusive one, and *inclusive* lower and *exclusive* upper endpoints.
+    """
+    return scanner.scan(src, delimiter)
+
+
 def _both_none(a: Any, b: Any) -> bool:
     """Shorthand function to see if both endpoints are None."""
     return a is None and b is None
@@ -60,85 +79,203 @@ def _both_filled(a: Any, b: Any) -> bool:
     return a is not None and b is not None
 
 
-def parse_ranges(
-    src: str,
+def _format_term(
+    inclusive: bool, lower: Optional[int], upper: Optional[int], delimiter: str
+) -> str:
+    """Format a parsed range back into a string for error messages."""
+    return "".join(
+        (
+            "" if inclusive else "^",
+            "" if lower is None else str(lower),
+            delimiter,
+            "" if upper is None else str(upper - 1),
+        )
+    )
+
+
+def resolve_terms(
+    terms: Iterable[scanner.Token],
     lower: Union[int, None] = None,
     upper: Union[int, None] = None,
     delimiter: str = DEFAULT_DELIMITER,
     implicit_inclusion: bool = False,
-) -> Iterable[ranges.Endpoints]:
-    """Parse a comma-separated ranges.
+) -> Iterator[Operation]:
+    """Resolve parsed ranges against the universe, into operations to be applied
+    from the left to right.
 
-    :param src: A string to be parsed.
+    :param terms: Parsed ranges, as returned by ``parse_terms``.
     :param lower: Inclusive lower endpoint of the entire range.
     :param upper: Inclusive upper endpoint of the entire range.
-    :param delimiter: A delimiter of endpoints.
+    :param delimiter: A delimiter of endpoints, used only for error messages.
     :param implicit_inclusion: Whether to include all integers when an exclusion range
            comes in first.
-    :return: An iterable of tuples which represents a range in *open-closed* form.
+    :return: An iterator of operations.
     """
-    result: List[ranges.Endpoints] = []
-
     if upper is not None:
         # make `upper` an exclusive endpoint during calculation since it's programmer-friendly
         upper += 1
 
-    for i, single_range in enumerate(
-        filter(bool, map(lambda e: e.strip(), src.split(",")))
-    ):
-        inclusive, (range_lower, range_upper) = parse_single_range(
-            single_range, delimiter
-        )
+    for i, (inclusive, range_lower, range_upper) in enumerate(terms):
         assert not _both_none(range_lower, range_upper)
 
         if inclusive:
             if _both_none(lower, range_lower) or _both_none(upper, range_upper):
-                raise ValueError(f"Endpoint is missing: {single_range}")
+                raise ValueError(
+                    "Endpoint is missing: "
+                    + _format_term(inclusive, range_lower, range_upper, delimiter)
+                )
 
             # complement endpoints with universe endpoints and crop the range to be added
-            range_lower = max(l for l in (lower, range_lower) if l is not None)
-            range_upper = min(u for u in (upper, range_upper) if u is not None)
-
-            ranges.add(result, (range_lower, range_upper))
+            yield (
+                True,
+                max(l for l in (lower, range_lower) if l is not None),
+                min(u for u in (upper, range_upper) if u is not None),
+            )
 
         elif i == 0 and implicit_inclusion:
-            # an exclusive range is given in first place, thus `ranges` is still empty
-            assert not inclusive
-            assert len(result) == 0
+            # an exclusive range is given in first place, thus nothing is included yet
 
             # it eventually results in adding 1-2 range(s) around the exclusive range
             # because all integers are included before the exclusion,
 
             # complement omitted endpoints with the entire range
-            range_lower = lower if range_lower is None else range_lower
-            range_upper = upper if range_upper is None else range_upper
+            complemented_lower = lower if range_lower is None else range_lower
+            complemented_upper = upper if range_upper is None else range_upper
 
-            for l, u in ((lower, range_lower), (range_upper, upper)):
+            for l, u in ((lower, complemented_lower), (complemented_upper, upper)):
                 if _both_none(l, u):
                     # one of 2 separated ranges is actually an empty range
                     continue
                 if not _both_filled(l, u):
                     # endpoints must be specified as we're now going to an add range
-                    raise ValueError(f"Endpoint is missing: {single_range}")
+                    raise ValueError(
+                        "Endpoint is missing: "
+                        + _format_term(inclusive, range_lower, range_upper, delimiter)
+                    )
                 assert l is not None
                 assert u is not None
-                ranges.add(result, (l, u))
+                yield True, l, u
 
-        elif _both_filled(range_lower, range_upper):
-            assert not inclusive
+        else:
+            # both endpoints are specified for a subtraction,
+            # or one endpoint is specified and another is None for cropping
+            yield False, range_lower, range_upper
 
-            # both endpoints of a range are specified
-            assert range_lower is not None
-            assert range_upper is not None
-            ranges.subtract(result, (range_lower, range_upper))
 
-        else:
-            assert not inclusive
+def evaluate_incremental(operations: Iterable[Operation]) -> ranges.Ranges:
+    """Apply operations to a ranges list one by one.
 
-            # one endpoint is specified, and another is None
-            assert not _both_filled(range_lower, range_upper)
-            assert not _both_none(range_lower, range_upper)
-            # ...thus, cropping is performed on only one side
-            ranges.crop(result, lower=range_upper, upper=range_lower)
+    Each operation takes O(n) time for the number of ranges in the list, but it
+    consumes `operations` lazily, which keeps the memory proportional to the result.
 
+    :param operations: Operations to apply, as returned by ``resolve_terms``.
+    :return: A list of ranges.
+    """
+    result: ranges.Ranges = []
+    for inclusive, lower, upper in operations:
+        if inclusive:
+            assert lower is not None
+            assert upper is not None
+            ranges.add(result, (lower, upper))
+        elif _both_filled(lower, upper):
+            assert lower is not None
+            assert upper is not None
+            ranges.subtract(result, (lower, upper))
+        else:
+            # ...thus, cropping is performed on only one side
+            ranges.crop(result, lower=upper, upper=lower)
     return result
+
+
+def apply_operations(operations: Iterable[Operation], target: Any) -> None:
+    """Apply operations to a container other than a list.
+
+    :param operations: Operations to apply, as returned by ``resolve_terms``.
+    :param target: A container which has ``add``, ``subtract`` and ``crop`` methods
+           with the same semantics as the functions in ``ranges``, such as
+           ``RangeSet`` and ``BlockRanges``.
+    """
+    for inclusive, lower, upper in operations:
+        if inclusive:
+            target.add((lower, upper))
+        elif _both_filled(lower, upper):
+            target.subtract((lower, upper))
+        else:
+            target.crop(upper, lower)
+
+
+ENGINES: Dict[str, Callable[[Iterable[Operation]], ranges.Ranges]] = {
+    "incremental": evaluate_incremental,
+    "sweep": sweep.evaluate,
+}
+
+
+def get_engine(name: str) -> Callable[[Iterable[Operation]], ranges.Ranges]:
+    """Look up an evaluation engine by its name.
+
+    :param name: The name of an engine in ``ENGINES``.
+    :return: A function which applies operations and returns a list of ranges.
+    """
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown engine: {name}") from None
+
+
+def parse_ranges(
+    src: str,
+    lower: Union[int, None] = None,
+    upper: Union[int, None] = None,
+    delimiter: str = DEFAULT_DELIMITER,
+    implicit_inclusion: bool = False,
+    engine: str = DEFAULT_ENGINE,
+) -> Iterable[ranges.Endpoints]:
+    """Parse a comma-separated ranges.
+
+    :param src: A string to be parsed.
+    :param lower: Inclusive lower endpoint of the entire range.
+    :param upper: Inclusive upper endpoint of the entire range.
+    :param delimiter: A delimiter of endpoints.
+    :param implicit_inclusion: Whether to include all integers when an exclusion range
+           comes in first.
+    :param engine: The name of an evaluation engine in ``ENGINES``. ``"incremental"``
+           applies ranges one by one, and ``"sweep"`` evaluates all ranges at once in
+           O(N log N) time, which is faster for expressions with thousands of ranges.
+    :return: An iterable of tuples which represents a range in *open-closed* form.
+    """
+    return get_engine(engine)(
+        resolve_terms(
+            parse_terms(src, delimiter), lower, upper, delimiter, implicit_inclusion
+        )
+    )
+
+
+def parse_into(
+    src: str,
+    target: Any,
+    lower: Union[int, None] = None,
+    upper: Union[int, None] = None,
+    delimiter: str = DEFAULT_DELIMITER,
+    implicit_inclusion: bool = False,
+) -> Any:
+    """Parse a comma-separated ranges into the given container.
+
+    Ranges are applied one by one to `target` in place, just like the incremental
+    engine does to a list.
+
+    :param src: A string to be parsed.
+    :param target: A container to apply ranges to. See ``apply_operations``.
+    :param lower: Inclusive lower endpoint of the entire range.
+    :param upper: Inclusive upper endpoint of the entire range.
+    :param delimiter: A delimiter of endpoints.
+    :param implicit_inclusion: Whether to include all integers when an exclusion range
+           comes in first.
+    :return: `target` itself.
+    """
+    apply_operations(
+        resolve_terms(
+            parse_terms(src, delimiter), lower, upper, delimiter, implicit_inclusion
+        ),
+        target,
+    )
+    return target
@@ -1,13 +1,15 @@
-from typing import Tuple, List, Any, Union
+from typing import Tuple, List, Any, Union, Callable, Optional
 
 Endpoints = Tuple[int, int]
 Ranges = List[Endpoints]
 
 
-def _test_ranges_sorted(ranges: Ranges):
-    return len(ranges) == 0 or (
-        all(r[0] < r[1] for r in ranges)
-        and all(prev[1] < next[0] for prev, next in zip(ranges, ranges[1:]))
+def _test_ranges_sorted(ranges: Ranges, start: int = 0, stop: Optional[int] = None):
+    """Test if ranges in ``ranges[start:stop]`` are non-empty, sorted and disjoint."""
+    window = ranges[max(start, 0) : stop]
+    return len(window) == 0 or (
+        all(r[0] < r[1] for r in window)
+        and all(prev[1] < next[0] for prev, next in zip(window, window[1:]))
     )
 
 
@@ -24,8 +26,8 @@ def find_index(ranges: Ranges, n: int) -> Tuple[bool, int]:
     :return: A 2-tuple; a boolean which indicates whether a range which involves `n` is
              in the list, and an index of the (perhaps nearest) range.
     """
-    # ensure ranges are sorted
-    assert _test_ranges_sorted(ranges)
+    # NOTE: ranges are supposed to be sorted; it's checked around every splice
+    #       in `_splice_ranges` rather than here, which would take O(n) time.
 
     # do binary search
     start = 0
@@ -76,10 +78,11 @@ def _splice_ranges(
     :param remove_count: The number of ranges to be removed.
     :param additions: The ranges to be added.
     """
-    assert _test_ranges_sorted(ranges)
     assert all(a[0] <= a[1] for a in additions)
-    _splice_list(ranges, index, remove_count, *((l, u) for l, u in additions if l < u))
-    assert _test_ranges_sorted(ranges)
+    additions = tuple((l, u) for l, u in additions if l < u)
+    _splice_list(ranges, index, remove_count, *additions)
+    # the splice affects only the added ranges and their neighbors
+    assert _test_ranges_sorted(ranges, index - 1, index + len(additions) + 1)
 
 
 def add(ranges: Ranges, addition: Endpoints) -> None:
@@ -150,7 +153,7 @@ def subtract(ranges: Ranges, subtraction: Endpoints) -> None:
     _splice_ranges(
         ranges,
         index_lower,
-        index_upper - index_lower + (1 if side_ranges else 0),
+        index_upper - index_lower + (1 if found_upper else 0),
         *side_ranges,
     )
 
@@ -186,3 +189,134 @@ def crop(ranges: Ranges, lower: Union[int, None], upper: Union[int, None]) -> No
             )
         else:
             _splice_ranges(ranges, index_upper, len(ranges) - index_upper)
+
+
+def _combine(a: Ranges, b: Ranges, op: Callable[[bool, bool], bool]) -> Ranges:
+    """Combine two ranges lists by sweeping their endpoints at once.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :param op: A function which tells whether an integer is to be included in the
+           result, from whether it is included in `a` and whether it is in `b`.
+    :return: A new ranges list.
+    """
+    assert _test_ranges_sorted(a)
+    assert _test_ranges_sorted(b)
+
+    result: Ranges = []
+    # indices of the next endpoints; an odd index means being inside of a range
+    ia, ib = 0, 0
+    na, nb = len(a) * 2, len(b) * 2
+    including = False
+    start = 0
+    while ia < na or ib < nb:
+        xa = a[ia >> 1][ia & 1] if ia < na else None
+        xb = b[ib >> 1][ib & 1] if ib < nb else None
+        if xb is None or (xa is not None and xa <= xb):
+            assert xa is not None
+            x = xa
+        else:
+            x = xb
+        # endpoints on the same coordinate are passed at once
+        if xa == x:
+            ia += 1
+        if xb == x:
+            ib += 1
+        now_including = op(ia & 1 == 1, ib & 1 == 1)
+        if now_including != including:
+            if now_including:
+                start = x
+            else:
+                result.append((start, x))
+            including = now_including
+
+    assert _test_ranges_sorted(result)
+    return result
+
+
+def union(a: Ranges, b: Ranges) -> Ranges:
+    """Return integers in either `a` or `b`, in O(n+m) time.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: A new ranges list.
+    """
+    return _combine(a, b, lambda in_a, in_b: in_a or in_b)
+
+
+def intersection(a: Ranges, b: Ranges) -> Ranges:
+    """Return integers in both `a` and `b`, in O(n+m) time.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: A new ranges list.
+    """
+    return _combine(a, b, lambda in_a, in_b: in_a and in_b)
+
+
+def difference(a: Ranges, b: Ranges) -> Ranges:
+    """Return integers in `a` but not in `b`, in O(n+m) time.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: A new ranges list.
+    """
+    return _combine(a, b, lambda in_a, in_b: in_a and not in_b)
+
+
+def symmetric_difference(a: Ranges, b: Ranges) -> Ranges:
+    """Return integers in exactly one of `a` and `b`, in O(n+m) time.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: A new ranges list.
+    """
+    return _combine(a, b, lambda in_a, in_b: in_a != in_b)
+
+
+def issubset(a: Ranges, b: Ranges) -> bool:
+    """Test if every integer in `a` is also in `b`.
+
+    It returns as soon as a range in `a` turns out not to be covered.
+
+    Note that two ranges lists are equal if and only if they represent the same
+    integers since they are normalized, so ``a == b`` works as an equality check
+    which also returns early.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: True if `a` is a subset of `b`.
+    """
+    assert _test_ranges_sorted(a)
+    assert _test_ranges_sorted(b)
+    j = 0
+    for lower, upper in a:
+        # skip ranges in `b` which end before the range in `a` ends
+        while j < len(b) and b[j][1] < upper:
+            j += 1
+        if j == len(b) or lower < b[j][0]:
+            return False
+    return True
+
+
+def isdisjoint(a: Ranges, b: Ranges) -> bool:
+    """Test if `a` and `b` have no integers in common.
+
+    It returns as soon as an overlap is found.
+
+    :param a: A ranges list.
+    :param b: Another ranges list.
+    :return: True if `a` and `b` are disjoint.
+    """
+    assert _test_ranges_sorted(a)
+    assert _test_ranges_sorted(b)
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if max(a[i][0], b[j][0]) < min(a[i][1], b[j][1]):
+            return False
+        # move on from the range which ends first
+        if a[i][1] <= b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return True
@@ -0,0 +1,345 @@
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from . import arrays
+from . import parsers
+from . import ranges
+
+# typecode of the boundary buffer; every boundary must fit in a signed 64-bit integer
+TYPECODE = "q"
+
+
+def _covered(bounds: "array[int]", start: int, end: int) -> int:
+    """Count integers covered by the ranges stored in ``bounds[start:end]``.
+
+    :param bounds: A flat boundary buffer.
+    :param start: An even index of the first lower endpoint.
+    :param end: An even index just after the last upper endpoint.
+    :return: The total length of the ranges.
+    """
+    return sum(bounds[start + 1 : end : 2]) - sum(bounds[start:end:2])
+
+
+class RangeSet:
+    """A set of integers stored as sorted, disjoint ranges.
+
+    Boundaries are kept in a flat ``array('q')`` in the form of
+    ``[lower0, upper0, lower1, upper1, ...]`` where every lower endpoint is
+    *inclusive* and every upper endpoint is *exclusive*, just like ``ranges.Ranges``.
+    Since the buffer is strictly increasing, an integer is contained in the set if and
+    only if the number of boundaries less than or equal to it is odd.
+    """
+
+    __slots__ = ("_bounds", "_len", "_prefix")
+
+    def __init__(self, ranges_: Iterable[ranges.Endpoints] = ()) -> None:
+        """
+        :param ranges_: Ranges to be added into the set. They may overlap each other
+               and don't have to be sorted.
+        """
+        self._bounds = array(TYPECODE)
+        self._len = 0
+        self._prefix: Optional[List[int]] = None
+        for r in ranges_:
+            self.add(r)
+
+    @classmethod
+    def from_str(
+        cls,
+        src: str,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        delimiter: str = parsers.DEFAULT_DELIMITER,
+        implicit_inclusion: bool = False,
+    ) -> "RangeSet":
+        """Make a set of integers represented in the given string.
+
+        See ``rangestr.rangestr`` for the arguments.
+        """
+        return cls._from_sorted(
+            parsers.parse_ranges(src, lower, upper, delimiter, implicit_inclusion)
+        )
+
+    @classmethod
+    def _from_sorted(cls, ranges_: Iterable[ranges.Endpoints]) -> "RangeSet":
+        """Make a set from ranges which are already sorted and disjoint."""
+        self = cls.__new__(cls)
+        self._bounds = array(TYPECODE)
+        for r in ranges_:
+            self._bounds.extend(r)
+        self._len = _covered(self._bounds, 0, len(self._bounds))
+        self._prefix = None
+        return self
+
+    @property
+    def bounds(self) -> ranges.Ranges:
+        """Ranges in the set, as a list of tuples of *inclusive* lower endpoint and
+        *exclusive* upper endpoint."""
+        it = iter(self._bounds)
+        return list(zip(it, it))
+
+    def __contains__(self, n: object) -> bool:
+        if not isinstance(n, int):
+            return False
+        return bisect_right(self._bounds, n) & 1 == 1
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        b = self._bounds
+        for i in range(0, len(b), 2):
+            yield from range(b[i], b[i + 1])
+
+    def _get_prefix(self) -> List[int]:
+        """Return the number of integers before each range, building it on demand.
+
+        It's discarded on every modification of the set.
+        """
+        if self._prefix is None:
+            b = self._bounds
+            lengths = (b[i + 1] - b[i] for i in range(0, len(b) - 2, 2))
+            self._prefix = [0, *accumulate(lengths)] if b else []
+        return self._prefix
+
+    def _nth(self, k: int) -> int:
+        """Return the `k`-th smallest integer in O(log n) time.
+
+        :param k: A non-negative index which is less than the length.
+        """
+        prefix = self._get_prefix()
+        r = bisect_right(prefix, k) - 1
+        return self._bounds[r * 2] + (k - prefix[r])
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """Return the `key`-th smallest integer, or a lazy view of a slice.
+
+        Indexing takes O(log n) time for the number of ranges, using the cumulative
+        number of integers of ranges; no integers are expanded.
+        """
+        if isinstance(key, slice):
+            return RangeSetSlice(self, range(*key.indices(self._len)))
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError("RangeSet index out of range")
+        return self._nth(key)
+
+    def sample(self, k: int, rng: Optional[random.Random] = None) -> List[int]:
+        """Choose `k` unique integers from the set at random, without expanding it.
+
+        :param k: The number of integers to choose.
+        :param rng: A random number generator. Defaults to the ``random`` module.
+        :return: A list of integers in selection order.
+        """
+        positions = (rng or random).sample(range(self._len), k)
+        return [self._nth(i) for i in positions]
+
+    def __bool__(self) -> bool:
+        return len(self._bounds) > 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.bounds!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self._len == other._len and self._bounds == other._bounds
+
+    def _combine(
+        self,
+        other: "RangeSet",
+        op: Callable[[ranges.Ranges, ranges.Ranges], ranges.Ranges],
+    ) -> "RangeSet":
+        return type(self)._from_sorted(op(self.bounds, other.bounds))
+
+    def union(self, other: "RangeSet") -> "RangeSet":
+        """Return a new set of integers in either set. See ``ranges.union``."""
+        return self._combine(other, ranges.union)
+
+    def intersection(self, other: "RangeSet") -> "RangeSet":
+        """Return a new set of integers in both sets. See ``ranges.intersection``."""
+        return self._combine(other, ranges.intersection)
+
+    def difference(self, other: "RangeSet") -> "RangeSet":
+        """Return a new set of integers only in this set. See ``ranges.difference``."""
+        return self._combine(other, ranges.difference)
+
+    def symmetric_difference(self, other: "RangeSet") -> "RangeSet":
+        """Return a new set of integers in exactly one of the sets.
+        See ``ranges.symmetric_difference``."""
+        return self._combine(other, ranges.symmetric_difference)
+
+    def issubset(self, other: "RangeSet") -> bool:
+        """Test if every integer in this set is also in `other`."""
+        return self._len <= other._len and ranges.issubset(self.bounds, other.bounds)
+
+    def issuperset(self, other: "RangeSet") -> bool:
+        """Test if every integer in `other` is also in this set."""
+        return other.issubset(self)
+
+    def isdisjoint(self, other: "RangeSet") -> bool:
+        """Test if the sets have no integers in common."""
+        return ranges.isdisjoint(self.bounds, other.bounds)
+
+    def __or__(self, other: object) -> "RangeSet":
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: object) -> "RangeSet":
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: object) -> "RangeSet":
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other: object) -> "RangeSet":
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.issubset(other)
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.issuperset(other)
+
+    def contains_many(self, values: Any) -> Any:
+        """Test if each of values is contained in the set.
+
+        See ``arrays.contains_many``.
+        """
+        return arrays._contains_bounds(self._bounds, values)
+
+    def select_many(self, values: Any) -> Any:
+        """Filter values which are contained in the set.
+
+        See ``arrays.select_many``.
+        """
+        return arrays._select_bounds(self._bounds, values)
+
+    def _replace(self, start: int, end: int, *additions: int) -> None:
+        """Replace boundaries in ``bounds[start:end]`` with `additions`, keeping the
+        length of the set up to date.
+
+        :param start: An index of the first boundary to be replaced.
+        :param end: An index just after the last boundary to be replaced.
+        :param additions: Boundaries to be put instead.
+        """
+        b = self._bounds
+        # widen the slice so that it covers whole ranges
+        s = start - (start & 1)
+        e = end + (end & 1)
+        before = _covered(b, s, e)
+        b[start:end] = array(TYPECODE, additions)
+        self._prefix = None
+        self._len += _covered(b, s, e - (end - start) + len(additions)) - before
+
+    def add(self, addition: ranges.Endpoints) -> None:
+        """Add a range to the set.
+
+        :param addition: A range to be added.
+        """
+        lower, upper = addition
+        if lower >= upper:
+            return
+        b = self._bounds
+        # an odd index means the endpoint is involved in an existing range,
+        # thus the range is going to be linked with the new one
+        i = bisect_left(b, lower)
+        j = bisect_right(b, upper)
+        self._replace(
+            i, j, *((lower,) if i & 1 == 0 else ()), *((upper,) if j & 1 == 0 else ())
+        )
+
+    def subtract(self, subtraction: ranges.Endpoints) -> None:
+        """Remove a range from the set.
+
+        :param subtraction: A range to be removed.
+        """
+        lower, upper = subtraction
+        if lower >= upper:
+            return
+        b = self._bounds
+        # an odd index means the endpoint splits an existing range
+        i = bisect_left(b, lower)
+        j = bisect_right(b, upper)
+        self._replace(i, j, *((lower,) if i & 1 else ()), *((upper,) if j & 1 else ()))
+
+    def crop(self, lower: Union[int, None], upper: Union[int, None]) -> None:
+        """Crop the set to fit the given endpoints.
+
+        :param lower: The *inclusive* lower endpoint.
+        :param upper: The *exclusive* upper endpoint.
+        """
+        b = self._bounds
+        if lower is not None and b and b[0] < lower:
+            self.subtract((b[0], lower))
+        if upper is not None and b and upper < b[-1]:
+            self.subtract((upper, b[-1]))
+
+
+class RangeSetSlice(Sequence[int]):
+    """A lazy view of ``RangeSet[a:b:step]``.
+
+    Integers are looked up from the set on demand, thus the view reflects later
+    modifications of the set.
+    """
+
+    __slots__ = ("_set", "_positions")
+
+    def __init__(self, range_set: RangeSet, positions: range) -> None:
+        """
+        :param range_set: A set to look up.
+        :param positions: Indices of integers in the set.
+        """
+        self._set = range_set
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return RangeSetSlice(self._set, self._positions[key])
+        return self._set._nth(self._positions[key])
+
+    def __contains__(self, n: object) -> bool:
+        range_set = self._set
+        if n not in range_set:
+            return False
+        assert isinstance(n, int)
+        # the index of `n` in the set
+        r = bisect_right(range_set._bounds, n) // 2
+        rank = range_set._get_prefix()[r] + n - range_set._bounds[r * 2]
+        return rank in self._positions
+
+    def __iter__(self) -> Iterator[int]:
+        positions = self._positions
+        if positions.step < 0:
+            yield from map(self._set._nth, positions)
+            return
+        # walk ranges from the first position rather than looking up each integer
+        bounds, prefix = self._set._bounds, self._set._get_prefix()
+        k, stop, step = positions.start, positions.stop, positions.step
+        while k < stop:
+            r = bisect_right(prefix, k) - 1
+            lower, base = bounds[r * 2], prefix[r]
+            end = min(stop, base + bounds[r * 2 + 1] - lower)
+            yield from range(lower + k - base, lower + end - base, step)
+            # the first position in the next range
+            k += -(-(end - k) // step) * step
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._set!r}, {self._positions!r})"
@@ -0,0 +1,106 @@
+"""Single-pass tokenizer for comma-separated ranges.
+
+The scanner walks the source once with a compiled pattern per delimiter, converting
+endpoints into integers directly instead of splitting and stripping the source into
+intermediate strings.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterator, Optional, Pattern, Tuple
+
+# A scanned range: a tuple of a boolean which indicates whether the range is inclusive
+# one, an *inclusive* lower endpoint and an *exclusive* upper endpoint.
+# Each endpoint will be None if it is omitted in the source.
+Token = Tuple[bool, Optional[int], Optional[int]]
+
+
+class ParseError(ValueError):
+    """An error raised on a malformed source, which knows where the error is."""
+
+    def __init__(self, message: str, src: str, position: int) -> None:
+        """
+        :param message: A description of the error.
+        :param src: The source being scanned.
+        :param position: A 0-based offset of the character which caused the error.
+        """
+        super().__init__(f"{message} at column {position + 1}: {src!r}")
+        self.src = src
+        self.position = position
+
+
+@lru_cache(maxsize=16)
+def _compile(delimiter: str) -> Pattern[str]:
+    """Compile a pattern which matches a single range, from its beginning to just
+    before the following comma (or the end of the source).
+
+    Every group matches an empty string rather than being skipped when the part is
+    omitted, which keeps the regular expression engine from backtracking.
+
+    :param delimiter: A delimiter of endpoints.
+    :return: A compiled pattern.
+    """
+    if not delimiter or "," in delimiter:
+        raise ValueError(f"Invalid delimiter: {delimiter!r}")
+    # an integer can't start with the delimiter, otherwise `-5` would be ambiguous
+    signs = "".join(c for c in "+-" if c != delimiter[0])
+    integer = rf"(?:[{re.escape(signs)}]?\d+(?:_\d+)*)?"
+    return re.compile(
+        rf"\s*(\^?)\s*({integer})\s*((?:{re.escape(delimiter)})?)\s*({integer})\s*"
+    )
+
+
+def scan(src: str, delimiter: str, offset: int = 0) -> Iterator[Token]:
+    """Scan comma-separated ranges.
+
+    Whitespaces around ranges and endpoints are ignored, and so are empty ranges.
+
+    :param src: A string to be scanned.
+    :param delimiter: A delimiter of endpoints.
+    :param offset: An offset added to positions in errors, for scanning a part of
+           a larger source.
+    :return: An iterator of tokens.
+    """
+    match = _compile(delimiter).match
+    end = len(src)
+    pos = 0
+    while pos <= end:
+        m = match(src, pos)
+        assert m is not None, "the pattern always matches"
+        caret, left, delim, right = m.groups()
+        stop = m.end()
+        if right and not delim:
+            # two integers without a delimiter in between, like `1 2`
+            raise ParseError("Unexpected character", src, offset + m.start(4))
+        if stop < end and src[stop] != ",":
+            if delim and src.startswith(delimiter, stop):
+                # reject a string like `-500-500` (possibly forgot to specify `delimiter`)
+                message = f"`{delimiter}` can't appear more than once"
+            else:
+                message = "Unexpected character"
+            raise ParseError(message, src, offset + stop)
+
+        if not delim:
+            if left:
+                # a range which contains just a *single* integer
+                n = int(left)
+                yield not caret, n, n + 1
+            elif caret:
+                raise ParseError("Integer is missing", src, offset + stop)
+            # otherwise, it is an empty range
+        elif left and right:
+            # a range which contains *multiple* integers
+            lower, upper = int(left), int(right)
+            if lower > upper:
+                lower, upper = upper, lower
+            yield not caret, lower, upper + 1
+        elif left or right:
+            yield (
+                not caret,
+                int(left) if left else None,
+                int(right) + 1 if right else None,
+            )
+        else:
+            raise ParseError("Both endpoints are omitted", src, offset + m.start(3))
+
+        pos = stop + 1
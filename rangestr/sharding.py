@@ -0,0 +1,80 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain as _chain
+from os import cpu_count
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+from . import ranges
+
+T = TypeVar("T")
+
+
+def shard(ranges_: Iterable[ranges.Endpoints], k: int) -> List[ranges.Ranges]:
+    """Split ranges into `k` lists which hold nearly the same number of integers.
+
+    The numbers of integers in shards differ by one at most; ranges are split where
+    needed. Each shard is a plain ranges list, which is cheap to pickle.
+
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param k: The number of shards.
+    :return: A list of `k` ranges lists, in ascending order.
+    """
+    if k < 1:
+        raise ValueError("`k` must be 1 or more")
+    ranges_ = list(ranges_)
+    quotient, remainder = divmod(sum(u - l for l, u in ranges_), k)
+
+    shards: List[ranges.Ranges] = []
+    it = iter(ranges_)
+    current: Optional[ranges.Endpoints] = next(it, None)
+    for i in range(k):
+        shard_: ranges.Ranges = []
+        # the first `remainder` shards take one more integer
+        needed = quotient + (1 if i < remainder else 0)
+        while needed > 0:
+            assert current is not None
+            lower, upper = current
+            if upper - lower <= needed:
+                shard_.append(current)
+                needed -= upper - lower
+                current = next(it, None)
+            else:
+                shard_.append((lower, lower + needed))
+                current = (lower + needed, upper)
+                needed = 0
+        shards.append(shard_)
+    return shards
+
+
+def iter_integers(ranges_: Iterable[ranges.Endpoints]) -> Iterator[int]:
+    """Iterate through integers in ranges, e.g. in a shard.
+
+    :param ranges_: Ranges to iterate through.
+    :return: An iterator of integers.
+    """
+    return _chain.from_iterable(map(lambda r: range(*r), ranges_))
+
+
+def map_shards(
+    func: Callable[[ranges.Ranges], T],
+    ranges_: Iterable[ranges.Endpoints],
+    k: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[T]:
+    """Apply a function to balanced shards of ranges in parallel.
+
+    Results are yielded in the order of shards as soon as they are available.
+
+    :param func: A function which takes a shard (a ranges list). It must be picklable
+           when a process pool is used, i.e. defined at the top level of a module.
+    :param ranges_: Sorted and disjoint ranges, as returned by ``parsers.parse_ranges``.
+    :param k: The number of shards. Defaults to the number of workers, or the number
+           of CPUs if `executor` is not given.
+    :param executor: An executor to run `func`. Defaults to a new
+           ``ProcessPoolExecutor`` which is shut down when iteration finishes.
+    :return: An iterator of results of `func`, one for each shard.
+    """
+    if executor is not None:
+        yield from executor.map(func, shard(ranges_, k or cpu_count() or 1))
+        return
+    with ProcessPoolExecutor(k) as pool:
+        yield from pool.map(func, shard(ranges_, k or cpu_count() or 1))
@@ -0,0 +1,101 @@
+import codecs
+import mmap
+from typing import IO, Iterator, Optional, Union
+
+from . import parsers
+from . import ranges
+from . import scanner
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+Source = Union[IO[str], IO[bytes], bytes, bytearray, memoryview, mmap.mmap]
+
+
+def _iter_text(source: Source, chunk_size: int, encoding: str) -> Iterator[str]:
+    """Read text from the source in chunks.
+
+    :param source: A file object, or an object which supports the buffer protocol.
+    :param chunk_size: The number of bytes (or characters for text files) per chunk.
+    :param encoding: An encoding used to decode bytes.
+    :return: An iterator of decoded chunks.
+    """
+    # an incremental decoder takes care of characters which cross chunk boundaries
+    decode = codecs.getincrementaldecoder(encoding)().decode
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield decode(view[start : start + chunk_size])
+    else:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk if isinstance(chunk, str) else decode(chunk)
+    yield decode(b"", True)
+
+
+def scan_stream(
+    source: Source,
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[scanner.Token]:
+    """Scan comma-separated ranges in the source chunk by chunk.
+
+    Only a chunk and a range which crosses the chunk boundary are kept in memory.
+
+    :param source: A text/binary file object, ``bytes``, ``memoryview`` or ``mmap``.
+    :param delimiter: A delimiter of endpoints.
+    :param chunk_size: The number of bytes (or characters for text files) per chunk.
+    :param encoding: An encoding used to decode bytes.
+    :return: An iterator of tokens, as returned by ``scanner.scan``.
+    """
+    # a range which is not terminated by a comma yet
+    carry = ""
+    # an offset of `carry` in the entire source
+    offset = 0
+    for chunk in _iter_text(source, chunk_size, encoding):
+        text = carry + chunk
+        cut = text.rfind(",")
+        if cut < 0:
+            carry = text
+            continue
+        yield from scanner.scan(text[:cut], delimiter, offset)
+        offset += cut + 1
+        carry = text[cut + 1 :]
+    yield from scanner.scan(carry, delimiter, offset)
+
+
+def parse_stream(
+    source: Source,
+    lower: Optional[int] = None,
+    upper: Optional[int] = None,
+    delimiter: str = parsers.DEFAULT_DELIMITER,
+    implicit_inclusion: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> ranges.Ranges:
+    """Parse comma-separated ranges in a file or a buffer, like ``parsers.parse_ranges``.
+
+    Ranges are applied as soon as they are scanned, so the memory is proportional to
+    the number of the resulting ranges rather than the size of the source.
+
+    :param source: A text/binary file object, ``bytes``, ``memoryview`` or ``mmap``.
+    :param lower: Inclusive lower endpoint of the entire range.
+    :param upper: Inclusive upper endpoint of the entire range.
+    :param delimiter: A delimiter of endpoints.
+    :param implicit_inclusion: Whether to include all integers when an exclusion range
+           comes in first.
+    :param chunk_size: The number of bytes (or characters for text files) per chunk.
+    :param encoding: An encoding used to decode bytes.
+    :return: A list of tuples which represents a range in *open-closed* form.
+    """
+    return parsers.evaluate_incremental(
+        parsers.resolve_terms(
+            scan_stream(source, delimiter, chunk_size, encoding),
+            lower,
+            upper,
+            delimiter,
+            implicit_inclusion,
+        )
+    )
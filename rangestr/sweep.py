@@ -0,0 +1,80 @@
+"""Sort-and-sweep evaluation of range operations.
+
+Applying operations from the left to right is equivalent to painting ranges one over
+another: an integer is included in the result if and only if the last operation which
+covers it is an inclusion. This module evaluates all operations at once by sweeping
+their endpoints in sorted order while keeping the latest covering operation on a heap,
+which takes O(N log N) time for N operations instead of O(N^2).
+"""
+
+from heapq import heapify, heappop, heappush
+from typing import Iterable, List, Optional, Tuple
+
+from . import ranges
+
+# An operation in the same form as ``parsers.Operation``
+_Operation = Tuple[bool, Optional[int], Optional[int]]
+
+
+def evaluate(operations: Iterable[_Operation]) -> ranges.Ranges:
+    """Apply operations to an empty ranges list at once.
+
+    :param operations: Operations to apply, as returned by ``parsers.resolve_terms``.
+    :return: A list of ranges.
+    """
+    operations = list(operations)
+    # Events are encoded into integers as ``coordinate * m + index * 2 + is_start``
+    # since sorting integers is much faster than sorting tuples.
+    m = 2 * len(operations) + 2
+    inclusive: List[bool] = []
+    # operations which are active from the beginning, as negated indices
+    active: List[int] = []
+    keys: List[int] = []
+
+    for index, (inc, lower, upper) in enumerate(operations):
+        inclusive.append(inc)
+        if lower is not None and upper is not None and lower >= upper:
+            # empty ranges paint nothing
+            continue
+        if lower is None:
+            active.append(-index)
+        else:
+            keys.append(lower * m + index * 2 + 1)
+        if upper is not None:
+            keys.append(upper * m + index * 2)
+
+    if not keys:
+        return []
+    keys.sort()
+    # a sentinel which flushes the state at the last coordinate
+    keys.append((keys[-1] // m + 1) * m)
+    heapify(active)
+    ended = bytearray(len(inclusive))
+
+    result: ranges.Ranges = []
+    including = False
+    start = 0
+    prev = keys[0] // m
+    for key in keys:
+        x, sub = divmod(key, m)
+        if x != prev:
+            # all events on the previous coordinate have been applied,
+            # so drop operations which have ended lazily and look at the state
+            while active and ended[-active[0]]:
+                heappop(active)
+            now_including = bool(active) and inclusive[-active[0]]
+            if now_including != including:
+                if now_including:
+                    start = prev
+                else:
+                    result.append((start, prev))
+                including = now_including
+            prev = x
+        if sub & 1:
+            heappush(active, -(sub >> 1))
+        else:
+            ended[sub >> 1] = 1
+
+    # inclusions are always bounded, thus the last range must have been closed
+    assert not including
+    return result
@@ -0,0 +1,73 @@
+from array import array
+from unittest import mock
+
+import pytest
+from parameterized import parameterized, param
+
+from rangestr import arrays, rangestr, to_numpy, contains_many, select_many, RangeSet
+from rangestr.arrays import ranges_to_numpy
+from tests import testcases
+
+np = pytest.importorskip("numpy")
+
+
+class TestToNumpy:
+    @parameterized.expand(testcases.valid_cases)
+    def test_valid_cases(self, expected, src, *args, **kwargs):
+        result = to_numpy(src, *args, **kwargs)
+        assert np.int64 == result.dtype
+        assert [*rangestr(src, *args, **kwargs)] == result.tolist()
+
+    def test_dtype(self):
+        assert np.int32 == to_numpy("1-5", dtype=np.int32).dtype
+
+    def test_out(self):
+        out = np.full(8, -1, dtype=np.int64)
+        result = to_numpy("1-3, 7, ^2", out=out)
+        assert [1, 3, 7] == result.tolist()
+        assert [1, 3, 7, -1, -1, -1, -1, -1] == out.tolist()
+
+    def test_out_too_short(self):
+        with pytest.raises(ValueError):
+            to_numpy("1-10", out=np.empty(5, dtype=np.int64))
+
+    def test_ranges_to_numpy(self):
+        assert [-3, -2, 5] == ranges_to_numpy([(-3, -1), (5, 6)]).tolist()
+
+
+class TestContainsMany:
+    RANGES = [(1, 4), (8, 11)]
+    VALUES = [0, 1, 3, 4, 7, 8, 10, 11, -5, 100]
+    MASK = [False, True, True, False, False, True, True, False, False, False]
+
+    @parameterized.expand(
+        [
+            param(lambda: np.array(TestContainsMany.VALUES)),
+            param(lambda: array("q", TestContainsMany.VALUES)),
+            param(lambda: memoryview(array("q", TestContainsMany.VALUES))),
+            param(lambda: list(TestContainsMany.VALUES)),
+        ]
+    )
+    def test_contains_many(self, make_values):
+        assert self.MASK == contains_many(self.RANGES, make_values()).tolist()
+        selected = [v for v, m in zip(self.VALUES, self.MASK) if m]
+        assert selected == select_many(self.RANGES, make_values()).tolist()
+
+    def test_rangeset(self):
+        rs = RangeSet(self.RANGES)
+        assert self.MASK == rs.contains_many(np.array(self.VALUES)).tolist()
+        assert [1, 3, 8, 10] == rs.select_many(self.VALUES).tolist()
+
+    @parameterized.expand(
+        [
+            param(lambda: array("q", TestContainsMany.VALUES)),
+            param(lambda: memoryview(array("q", TestContainsMany.VALUES))),
+            param(lambda: list(TestContainsMany.VALUES)),
+        ]
+    )
+    def test_without_numpy(self, make_values):
+        with mock.patch.object(arrays, "np", None):
+            assert self.MASK == contains_many(self.RANGES, make_values())
+            assert [1, 3, 8, 10] == select_many(self.RANGES, make_values())
+            with pytest.raises(ImportError):
+                to_numpy("1-5")
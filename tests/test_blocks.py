@@ -0,0 +1,81 @@
+import random
+
+from parameterized import parameterized, param
+
+from rangestr.blocks import BlockRanges
+from rangestr.parsers import parse_into, parse_ranges
+from rangestr.ranges import add, subtract, crop, find_index
+from tests import testcases
+
+
+class TestBlockRanges:
+    @parameterized.expand(testcases.valid_cases)
+    def test_parse_into(self, expected, src, *args, **kwargs):
+        target = BlockRanges(load=2)
+        assert target is parse_into(src, target, *args, **kwargs)
+        assert expected == target.to_list()
+
+    @parameterized.expand(
+        [
+            param([(0, 100)], [(0, 20), (80, 100)], (20, 80)),
+            param([(0, 20), (40, 60), (80, 100)], [(0, 20), (80, 100)], (40, 60)),
+            param([(0, 100)], [(80, 100)], (0, 90)),
+            param([(20, 80)], [(20, 80)], (40, 60)),
+        ]
+    )
+    def test_add(self, expected, initial, addition):
+        br = BlockRanges(initial)
+        br.add(addition)
+        assert expected == br.to_list()
+
+    @parameterized.expand(
+        [
+            param([(0, 33), (66, 100)], [(0, 100)], (33, 66)),
+            param([(0, 20), (80, 100)], [(0, 20), (40, 60), (80, 100)], (30, 70)),
+            param([], [(0, 20), (40, 60), (80, 100)], (0, 100)),
+            param([(0, 20), (40, 60)], [(0, 20), (40, 60)], (20, 30)),
+        ]
+    )
+    def test_subtract(self, expected, initial, subtraction):
+        br = BlockRanges(initial)
+        br.subtract(subtraction)
+        assert expected == br.to_list()
+
+    @parameterized.expand(
+        [param(seed, load) for seed in range(5) for load in (2, 3, 64)]
+    )
+    def test_agrees_with_ranges(self, seed, load):
+        rnd = random.Random(seed)
+        expected = []
+        br = BlockRanges(load=load)
+        for _ in range(3000):
+            lower = rnd.randrange(3000)
+            r = (lower, lower + rnd.randrange(1, 30 if rnd.random() < 0.95 else 600))
+            p = rnd.random()
+            if p < 0.6:
+                add(expected, r)
+                br.add(r)
+            elif p < 0.98:
+                subtract(expected, r)
+                br.subtract(r)
+            else:
+                crop(expected, lower=r[0] // 20, upper=3000 - r[0] // 20)
+                br.crop(r[0] // 20, 3000 - r[0] // 20)
+            assert expected == br.to_list()
+            assert len(expected) == len(br)
+            assert [b[-1][1] for b in br._blocks] == br._maxes
+            assert all(0 < len(b) <= load * 2 for b in br._blocks)
+            n = rnd.randrange(-10, 3100)
+            assert find_index(expected, n) == br.find_index(n)
+
+    def test_equivalent_to_parse_ranges(self):
+        src = ",".join(f"{i * 3}-{i * 3 + 1}" for i in range(5000)) + ",^100-9000"
+        target = BlockRanges(load=16)
+        assert parse_ranges(src) == parse_into(src, target).to_list()
+
+    def test_from_sorted(self):
+        initial = [(i * 4, i * 4 + 2) for i in range(100)]
+        br = BlockRanges._from_sorted(initial, load=8)
+        assert initial == br.to_list()
+        br.add((2, 4))
+        assert (0, 6) == next(iter(br))
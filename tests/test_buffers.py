@@ -0,0 +1,52 @@
+import pytest
+from parameterized import parameterized, param
+
+from rangestr import iter_chunks, rangestr
+from rangestr.buffers import iter_range_chunks
+
+RANGES = [(1, 4), (8, 11), (20, 21), (30, 40)]
+INTEGERS = [n for r in RANGES for n in range(*r)]
+
+
+class TestIterRangeChunks:
+    @parameterized.expand(
+        [
+            param(size, reverse, step)
+            for size in (1, 2, 3, 7, 100)
+            for reverse in (False, True)
+            for step in (1, 2, 3, 11, 50)
+        ]
+    )
+    def test_iter_range_chunks(self, size, reverse, step):
+        chunks = [c.tolist() for c in iter_range_chunks(RANGES, size, reverse, step)]
+        expected = (INTEGERS[::-1] if reverse else INTEGERS)[::step]
+        assert expected == [n for c in chunks for n in c]
+        assert all(len(c) == size for c in chunks[:-1])
+
+    def test_format(self):
+        chunk = next(iter_range_chunks(RANGES))
+        assert "q" == chunk.format
+        assert 8 == chunk.itemsize
+        assert len(INTEGERS) * 8 == len(chunk.tobytes())
+
+    def test_reuse(self):
+        reused = [*iter_range_chunks(RANGES, size=4)]
+        assert reused[0].obj is reused[1].obj
+        copied = [*iter_range_chunks(RANGES, size=4, reuse=False)]
+        assert copied[0].obj is not copied[1].obj
+        assert INTEGERS == [n for c in copied for n in c.tolist()]
+
+    def test_empty(self):
+        assert [] == [*iter_range_chunks([])]
+
+    @parameterized.expand([param(size=0), param(step=0)])
+    def test_invalid(self, **kwargs):
+        with pytest.raises(ValueError):
+            next(iter_range_chunks(RANGES, **kwargs))
+
+
+class TestIterChunks:
+    def test_iter_chunks(self):
+        chunks = [c.tolist() for c in iter_chunks("5-, ^7", upper=12, size=3)]
+        assert [[5, 6, 8], [9, 10, 11], [12]] == chunks
+        assert [*rangestr("5-, ^7", upper=12)] == sum(chunks, [])
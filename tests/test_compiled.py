@@ -0,0 +1,79 @@
+import pytest
+from parameterized import parameterized
+
+import rangestr
+from rangestr.compiled import Expression, ExpressionCache
+from tests import testcases
+
+
+class TestExpression:
+    @parameterized.expand(testcases.valid_cases)
+    def test_valid_cases(self, expected, src, *args, delimiter="-", **kwargs):
+        assert expected == Expression(src, delimiter).ranges(*args, **kwargs)
+
+    @parameterized.expand(testcases.error_cases_missing_endpoint)
+    def test_missing_endpoint(self, src, *args, delimiter="-", **kwargs):
+        expression = Expression(src, delimiter)
+        with pytest.raises(ValueError):
+            expression.ranges(*args, **kwargs)
+
+    def test_reusable(self):
+        expression = rangestr.compile("1-3, 8-, ^9")
+        assert [1, 2, 3, 8, 10] == [*expression(upper=10)]
+        assert [2, 3, 8] == [*expression(lower=2, upper=8)]
+        assert [8, 10, 11] == [*expression(lower=5, upper=11, engine="sweep")]
+
+    def test_syntax_error_on_compile(self):
+        with pytest.raises(ValueError):
+            rangestr.compile("-5-0")
+
+
+class TestExpressionCache:
+    def test_hits_and_misses(self):
+        cache = ExpressionCache(maxsize=2)
+        first = cache.get("1-5")
+        assert first is cache.get("1-5")
+        assert first is not cache.get("1..5", delimiter="..")
+        assert (1, 2, 0, 2, 2) == cache.info()
+
+    def test_eviction(self):
+        cache = ExpressionCache(maxsize=2)
+        one = cache.get("1")
+        cache.get("2")
+        cache.get("1")  # "2" becomes the least recently used one
+        cache.get("3")
+        assert one is cache.get("1")
+        assert 1 == cache.info().evictions
+        assert 2 == len(cache)
+        cache.resize(1)
+        assert 1 == len(cache)
+
+    def test_disabled(self):
+        cache = ExpressionCache(maxsize=0)
+        assert cache.get("1") is not cache.get("1")
+        assert 0 == len(cache)
+
+    def test_max_length(self):
+        cache = ExpressionCache(max_length=3)
+        cache.get("1-5")
+        cache.get("1-50")
+        assert 1 == len(cache)
+
+    def test_errors_are_not_cached(self):
+        cache = ExpressionCache()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.get("-5-0")
+        assert 0 == len(cache)
+
+    def test_clear(self):
+        cache = ExpressionCache()
+        cache.get("1")
+        cache.clear()
+        assert (0, 0, 0, cache.maxsize, 0) == cache.info()
+
+    def test_used_by_rangestr(self):
+        rangestr.compiled.default_cache.clear()
+        assert [1, 2, 3] == [*rangestr.rangestr("1-", upper=3)]
+        assert [2, 3, 4] == [*rangestr.rangestr("1-", lower=2, upper=4)]
+        assert 1 == rangestr.compiled.default_cache.info().hits
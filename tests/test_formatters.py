@@ -0,0 +1,96 @@
+import random
+from itertools import chain, count
+
+import pytest
+from parameterized import parameterized, param
+
+from rangestr import format_integers, rangestr
+from rangestr.formatters import compress, format_ranges
+from rangestr.parsers import parse_ranges
+
+
+class TestCompress:
+    @parameterized.expand(
+        [
+            param([], []),
+            param([(5, 6)], [5]),
+            param([(1, 4), (8, 9)], [1, 2, 3, 8]),
+            param([(1, 4)], [1, 1, 2, 3, 3]),
+            param([(-3, 1)], [-3, -2, -1, 0]),
+        ]
+    )
+    def test_compress(self, expected, values):
+        assert expected == [*compress(values)]
+        assert expected == [*compress(reversed(values), assume_sorted=False)]
+
+    def test_unsorted(self):
+        with pytest.raises(ValueError):
+            [*compress([1, 3, 2])]
+
+    def test_lazy(self):
+        it = compress(iter(range(10**12)))
+        assert (0, 10**12) == next(it)
+
+
+class TestFormatRanges:
+    @parameterized.expand(
+        [
+            param("", []),
+            param("5", [(5, 6)]),
+            param("1-3, 8", [(1, 4), (8, 9)]),
+            param("-10..-5, 0..1", [(-10, -4), (0, 2)], delimiter=".."),
+            param("1-3,8", [(1, 4), (8, 9)], separator=","),
+            param("-3, 8-", [(0, 4), (8, 20)], lower=0, upper=10),
+            param("-10", [(0, 20)], lower=0, upper=10),
+            param("1-3, 5", [(1, 4), (5, 6)], lower=0, upper=10, exclusions=True),
+            param(
+                "0-99, ^50", [(0, 50), (51, 100)], lower=0, upper=99, exclusions=True
+            ),
+            param("0-99, ^-9, ^90-", [(10, 90)], lower=0, upper=99, exclusions=True),
+            param("1-5, ^3", [(1, 3), (4, 6)], lower=1, upper=5, exclusions=True),
+        ]
+    )
+    def test_format_ranges(self, expected, ranges_, **kwargs):
+        kwargs.setdefault("delimiter", "-")
+        assert expected == format_ranges(ranges_, **kwargs)
+        kwargs.pop("exclusions", None)
+        kwargs.pop("separator", None)
+        assert ranges_ == parse_ranges(expected, **kwargs)
+
+    @parameterized.expand(
+        [
+            param([(-1, 0)]),
+            param([(0, 1)], lower=-1, upper=5, exclusions=True),
+            param([(0, 1)], separator=";"),
+            param([(0, 1)], exclusions=True),
+            param([(0, 1)], lower=5, upper=0),
+        ]
+    )
+    def test_invalid(self, ranges_, **kwargs):
+        with pytest.raises(ValueError):
+            format_ranges(ranges_, **kwargs)
+
+    def test_negative_universe(self):
+        assert "0" == format_ranges([(0, 1)], "..", -1, 5, exclusions=True)
+        assert "0" == format_ranges([(0, 1)], "-", 0, 5, exclusions=True)
+
+
+class TestFormatIntegers:
+    def test_round_trip(self):
+        rnd = random.Random(0)
+        for _ in range(200):
+            values = [rnd.randrange(-50, 50) for _ in range(rnd.randrange(30))]
+            for exclusions in (False, True):
+                src = format_integers(
+                    values,
+                    delimiter="~",
+                    lower=-50,
+                    upper=49,
+                    exclusions=exclusions,
+                    assume_sorted=False,
+                )
+                expected = sorted(set(values))
+                assert expected == [*rangestr(src, -50, 49, delimiter="~")]
+
+    def test_sorted(self):
+        assert "1-3, 8-10" == format_integers(rangestr("1-3, 8-10"))
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from parameterized import parameterized, param
 
@@ -55,3 +57,42 @@ class TestParseRanges:
     def test_missing_endpoint(self, src, *args, **kwargs):
         with pytest.raises(ValueError):
             parse_ranges(src, *args, **kwargs)
+
+
+def _random_expression(rnd, terms):
+    parts = []
+    for _ in range(terms):
+        lower = rnd.randrange(-1000, 1000)
+        upper = lower + rnd.randrange(50)
+        part = rnd.choice([f"{lower}..{upper}", f"{lower}..", f"..{upper}", f"{lower}"])
+        parts.append("^" + part if rnd.random() < 0.4 else part)
+    return ",".join(parts)
+
+
+class TestEngines:
+    @parameterized.expand(testcases.valid_cases)
+    def test_valid_cases(self, expected, src, *args, **kwargs):
+        assert expected == parse_ranges(src, *args, engine="sweep", **kwargs)
+
+    @parameterized.expand(testcases.error_cases_missing_endpoint)
+    def test_missing_endpoint(self, src, *args, **kwargs):
+        with pytest.raises(ValueError):
+            parse_ranges(src, *args, engine="sweep", **kwargs)
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            parse_ranges("1-5", engine="unknown")
+
+    @parameterized.expand([param(seed) for seed in range(20)])
+    def test_engines_agree(self, seed):
+        rnd = random.Random(seed)
+        src = _random_expression(rnd, rnd.randrange(1, 200))
+        kwargs = dict(
+            lower=-1200,
+            upper=1200,
+            delimiter="..",
+            implicit_inclusion=rnd.random() < 0.5,
+        )
+        assert parse_ranges(src, engine="incremental", **kwargs) == parse_ranges(
+            src, engine="sweep", **kwargs
+        )
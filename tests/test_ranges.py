@@ -1,3 +1,5 @@
+import random
+
 from parameterized import parameterized, param
 
 from rangestr.ranges import (
@@ -6,6 +8,12 @@ from rangestr.ranges import (
     add,
     subtract,
     _splice_list,
+    union,
+    intersection,
+    difference,
+    symmetric_difference,
+    issubset,
+    isdisjoint,
 )
 
 
@@ -93,6 +101,8 @@ class TestSubtract:
             ([(0, 50)], [(0, 100)], (50, 100)),
             # shrinkage and removal
             ([(0, 20), (80, 100)], [(0, 30), (40, 60), (70, 100)], (20, 80)),
+            # subtraction which starts at the upper endpoint of a range
+            ([(0, 20), (40, 60)], [(0, 20), (40, 60)], (20, 30)),
         ]
     )
     def test_subtract(self, expected, ranges, subtraction):
@@ -161,3 +171,72 @@ class TestCrop:
     def test_crop(self, expected, ranges, **kwargs):
         crop(ranges, **kwargs)
         assert expected == ranges
+
+
+def _random_ranges(rnd):
+    result = []
+    for _ in range(rnd.randrange(20)):
+        lower = rnd.randrange(200)
+        add(result, (lower, lower + rnd.randrange(1, 20)))
+    return result
+
+
+def _to_set(ranges):
+    return {n for r in ranges for n in range(*r)}
+
+
+class TestSetAlgebra:
+    A = [(0, 20), (40, 60), (80, 100)]
+    B = [(10, 50), (60, 70), (100, 110)]
+
+    def test_union(self):
+        assert [(0, 70), (80, 110)] == union(self.A, self.B)
+
+    def test_intersection(self):
+        assert [(10, 20), (40, 50)] == intersection(self.A, self.B)
+
+    def test_difference(self):
+        assert [(0, 10), (50, 60), (80, 100)] == difference(self.A, self.B)
+
+    def test_symmetric_difference(self):
+        assert [(0, 10), (20, 40), (50, 70), (80, 110)] == symmetric_difference(
+            self.A, self.B
+        )
+
+    @parameterized.expand(
+        [
+            param(True, [], []),
+            param(True, [], [(0, 10)]),
+            param(False, [(0, 10)], []),
+            param(True, [(2, 5), (7, 10)], [(0, 10)]),
+            param(False, [(2, 5), (7, 11)], [(0, 10)]),
+            param(False, [(0, 10)], [(0, 5), (6, 10)]),
+            param(True, [(0, 5), (20, 25)], [(0, 5), (10, 15), (20, 30)]),
+        ]
+    )
+    def test_issubset(self, expected, a, b):
+        assert expected == issubset(a, b)
+
+    @parameterized.expand(
+        [
+            param(True, [], [(0, 10)]),
+            param(True, [(0, 10)], [(10, 20)]),
+            param(False, [(0, 11)], [(10, 20)]),
+            param(True, [(0, 5), (10, 15)], [(5, 10), (15, 20)]),
+            param(False, [(0, 5), (10, 15)], [(5, 10), (14, 20)]),
+        ]
+    )
+    def test_isdisjoint(self, expected, a, b):
+        assert expected == isdisjoint(a, b)
+
+    @parameterized.expand([param(seed) for seed in range(20)])
+    def test_agrees_with_set(self, seed):
+        rnd = random.Random(seed)
+        a, b = _random_ranges(rnd), _random_ranges(rnd)
+        sa, sb = _to_set(a), _to_set(b)
+        assert sa | sb == _to_set(union(a, b))
+        assert sa & sb == _to_set(intersection(a, b))
+        assert sa - sb == _to_set(difference(a, b))
+        assert sa ^ sb == _to_set(symmetric_difference(a, b))
+        assert (sa <= sb) == issubset(a, b)
+        assert sa.isdisjoint(sb) == isdisjoint(a, b)
@@ -0,0 +1,162 @@
+import random
+
+import pytest
+
+from parameterized import parameterized, param
+
+from rangestr import RangeSet
+from rangestr.ranges import add, subtract, crop
+from tests import testcases
+
+
+class TestRangeSet:
+    @parameterized.expand(testcases.valid_cases)
+    def test_from_str(self, expected, src, *args, **kwargs):
+        rs = RangeSet.from_str(src, *args, **kwargs)
+        assert expected == rs.bounds
+        assert sum(u - l for l, u in expected) == len(rs)
+
+    def test_contains(self):
+        rs = RangeSet.from_str("1-3, 8-10")
+        assert [1, 2, 3, 8, 9, 10] == [n for n in range(-5, 20) if n in rs]
+        assert "1" not in rs
+
+    def test_iter(self):
+        assert [1, 2, 3, 8, 9, 10] == [*RangeSet.from_str("1-3, 8-10")]
+
+    def test_large(self):
+        rs = RangeSet.from_str("0-99999999, ^50000000")
+        assert 99999999 == len(rs)
+        assert 7400213 in rs
+        assert 50000000 not in rs
+
+    @parameterized.expand(
+        [
+            param([(0, 100)], [(0, 20), (80, 100)], (20, 80)),
+            param([(0, 20), (40, 60), (80, 100)], [(0, 20), (80, 100)], (40, 60)),
+            param([(0, 100)], [(80, 100)], (0, 90)),
+            param([(20, 80)], [(20, 80)], (40, 60)),
+            param([(0, 20)], [(0, 20)], (5, 5)),
+        ]
+    )
+    def test_add(self, expected, initial, addition):
+        rs = RangeSet(initial)
+        rs.add(addition)
+        assert expected == rs.bounds
+        assert sum(u - l for l, u in expected) == len(rs)
+
+    @parameterized.expand(
+        [
+            param([(0, 33), (66, 100)], [(0, 100)], (33, 66)),
+            param([(0, 20), (80, 100)], [(0, 20), (40, 60), (80, 100)], (30, 70)),
+            param([], [(0, 20), (40, 60), (80, 100)], (0, 100)),
+            param([(0, 20), (80, 100)], [(0, 30), (40, 60), (70, 100)], (20, 80)),
+            param([], [], (0, 50)),
+        ]
+    )
+    def test_subtract(self, expected, initial, subtraction):
+        rs = RangeSet(initial)
+        rs.subtract(subtraction)
+        assert expected == rs.bounds
+        assert sum(u - l for l, u in expected) == len(rs)
+
+    @parameterized.expand(
+        [
+            param([(20, 33), (66, 80)], [(0, 33), (66, 100)], lower=20, upper=80),
+            param([(40, 60), (80, 100)], [(0, 20), (40, 60), (80, 100)], lower=30),
+            param([(0, 20), (40, 50)], [(0, 20), (40, 60), (80, 100)], upper=50),
+            param([], [(0, 20)], lower=50, upper=None),
+        ]
+    )
+    def test_crop(self, expected, initial, lower=None, upper=None):
+        rs = RangeSet(initial)
+        rs.crop(lower, upper)
+        assert expected == rs.bounds
+        assert sum(u - l for l, u in expected) == len(rs)
+
+    def test_agrees_with_ranges(self):
+        rnd = random.Random(0)
+        expected = []
+        rs = RangeSet()
+        for _ in range(2000):
+            lower = rnd.randrange(1000)
+            r = (lower, lower + rnd.randrange(30))
+            if rnd.random() < 0.6:
+                add(expected, r)
+                rs.add(r)
+            elif rnd.random() < 0.9:
+                subtract(expected, r)
+                rs.subtract(r)
+            else:
+                crop(expected, lower=r[0] // 10, upper=None)
+                rs.crop(r[0] // 10, None)
+            assert expected == rs.bounds
+            assert sum(u - l for l, u in expected) == len(rs)
+
+    def test_set_algebra(self):
+        a = RangeSet.from_str("0-19, 40-59")
+        b = RangeSet.from_str("10-49")
+        assert [(0, 60)] == (a | b).bounds
+        assert [(10, 20), (40, 50)] == (a & b).bounds
+        assert [(0, 10), (50, 60)] == (a - b).bounds
+        assert [(0, 10), (20, 40), (50, 60)] == (a ^ b).bounds
+        assert 60 == len(a | b)
+        assert (a & b) <= a
+        assert not a <= b
+        assert a >= (a & b)
+        assert not a.isdisjoint(b)
+        assert (a - b).isdisjoint(b)
+
+    def test_eq(self):
+        assert RangeSet.from_str("1-3, 4-5") == RangeSet.from_str("1-5")
+        assert RangeSet.from_str("1-3") != RangeSet.from_str("1-4")
+        assert RangeSet() != []
+
+    def test_getitem(self):
+        rs = RangeSet.from_str("1-3, 8-10, 20")
+        expected = [*rs]
+        for k in range(-len(expected), len(expected)):
+            assert expected[k] == rs[k]
+        for k in (len(expected), -len(expected) - 1):
+            with pytest.raises(IndexError):
+                rs[k]
+
+    def test_getitem_after_modification(self):
+        rs = RangeSet.from_str("1-3, 8-10")
+        assert 8 == rs[3]
+        rs.add((4, 6))
+        assert 4 == rs[3]
+
+    @parameterized.expand(
+        [
+            param(slice(None)),
+            param(slice(2, 7)),
+            param(slice(1, None, 3)),
+            param(slice(None, None, -1)),
+            param(slice(-2, 1, -2)),
+            param(slice(100, 200)),
+        ]
+    )
+    def test_slice(self, key):
+        rs = RangeSet.from_str("1-3, 8-10, 20, 30-40")
+        expected = [*rs][key]
+        view = rs[key]
+        assert expected == [*view]
+        assert len(expected) == len(view)
+        assert expected == [view[i] for i in range(len(view))]
+        assert expected[1:3] == [*view[1:3]]
+        assert [n in view for n in range(45)] == [n in expected for n in range(45)]
+
+    def test_large_index(self):
+        rs = RangeSet.from_str("0-99999999, ^50000000")
+        assert 50000001 == rs[50000000]
+        assert [1999999, 2000000] == [*rs[1999999:2000001]]
+
+    def test_sample(self):
+        rs = RangeSet.from_str("0-99999999, ^50000000-59999999")
+        sample = rs.sample(1000, random.Random(0))
+        assert 1000 == len(set(sample))
+        assert all(n in rs for n in sample)
+        assert sorted([*RangeSet.from_str("1-3, 8")]) == sorted(
+            RangeSet.from_str("1-3, 8").sample(4)
+        )
@@ -0,0 +1,53 @@
+import pytest
+from parameterized import parameterized, param
+
+from rangestr.scanner import scan, ParseError
+
+
+class TestScan:
+    @parameterized.expand(
+        [
+            param([], "", delimiter="-"),
+            param([], " , ,", delimiter="-"),
+            param([(True, 0, 6)], "0-5", delimiter="-"),
+            param([(True, 0, 6)], "5-0", delimiter="-"),
+            param([(True, 0, None)], "0-", delimiter="-"),
+            param([(True, None, 6)], "-5", delimiter="-"),
+            param([(True, -5, -4)], "-5", delimiter=".."),
+            param([(True, -5, 6)], "-5..+5", delimiter=".."),
+            param([(False, 0, 6)], "^0-5", delimiter="-"),
+            param([(False, 0, 6)], " ^ 0 - 5 ", delimiter="-"),
+            param([(True, 1, 4), (False, 2, 3), (True, 8, 9)], "1-3,^2, 8", "-"),
+            param([(True, 1000, 1001)], "1_000", delimiter="-"),
+        ]
+    )
+    def test_scan(self, expected, src, delimiter):
+        assert expected == [*scan(src, delimiter)]
+
+    @parameterized.expand(
+        [
+            # a position of the offending character
+            param(2, "-5-0", delimiter="-"),
+            param(7, "1,-5..0..5", delimiter=".."),
+            param(1, "1-2", delimiter=".."),
+            param(2, "1 2", delimiter="-"),
+            param(3, "1,^", delimiter="-"),
+            param(3, "1, -", delimiter="-"),
+            param(2, "1,a", delimiter="-"),
+        ]
+    )
+    def test_error_position(self, position, src, delimiter):
+        with pytest.raises(ParseError) as e:
+            [*scan(src, delimiter)]
+        assert position == e.value.position
+        assert isinstance(e.value, ValueError)
+
+    def test_offset(self):
+        with pytest.raises(ParseError) as e:
+            [*scan("1,a", "-", offset=100)]
+        assert 102 == e.value.position
+
+    @parameterized.expand([param(""), param("a,b")])
+    def test_invalid_delimiter(self, delimiter):
+        with pytest.raises(ValueError):
+            [*scan("1", delimiter)]
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from parameterized import parameterized, param
+
+from rangestr.parsers import parse_ranges
+from rangestr.sharding import shard, map_shards, iter_integers
+
+
+def _count(shard_):
+    return sum(u - l for l, u in shard_)
+
+
+class TestShard:
+    @parameterized.expand(
+        [
+            param([[(0, 5)], [(5, 10)]], [(0, 10)], 2),
+            param([[(0, 4)], [(4, 7)], [(7, 10)]], [(0, 10)], 3),
+            param([[(0, 2), (5, 6)], [(6, 8), (9, 10)]], [(0, 2), (5, 8), (9, 10)], 2),
+            param([[(0, 1)], [(1, 2)], [], []], [(0, 2)], 4),
+            param([[], []], [], 2),
+        ]
+    )
+    def test_shard(self, expected, ranges, k):
+        assert expected == shard(ranges, k)
+
+    @parameterized.expand([param(k) for k in (1, 2, 3, 7, 16)])
+    def test_balanced(self, k):
+        ranges = parse_ranges("0-999, ^100-149, 2000-2002, 3000-3999, ^3500")
+        shards = shard(ranges, k)
+        assert k == len(shards)
+        counts = [_count(s) for s in shards]
+        assert max(counts) - min(counts) <= 1
+        assert [*iter_integers(ranges)] == [n for s in shards for n in iter_integers(s)]
+
+    def test_invalid_k(self):
+        with pytest.raises(ValueError):
+            shard([(0, 10)], 0)
+
+
+class TestMapShards:
+    def test_process_pool(self):
+        assert [5, 5, 5, 5] == [*map_shards(_count, [(0, 20)], k=4)]
+
+    def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            results = [*map_shards(_count, [(0, 10), (20, 23)], k=3, executor=executor)]
+        assert [5, 4, 4] == results
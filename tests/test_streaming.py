@@ -0,0 +1,54 @@
+import io
+import mmap
+
+import pytest
+from parameterized import parameterized, param
+
+from rangestr.parsers import parse_ranges
+from rangestr.scanner import ParseError
+from rangestr.streaming import parse_stream, scan_stream
+from tests import testcases
+
+SRC = "1-3, 8-10, ^9, 20-, 5, ^25-26, 100-200, ^150-"
+
+
+class TestParseStream:
+    @parameterized.expand(testcases.valid_cases)
+    def test_valid_cases(self, expected, src, *args, **kwargs):
+        assert expected == parse_stream(io.StringIO(src), *args, **kwargs)
+
+    @parameterized.expand(
+        [
+            param(lambda: io.StringIO(SRC)),
+            param(lambda: io.BytesIO(SRC.encode())),
+            param(lambda: SRC.encode()),
+            param(lambda: bytearray(SRC.encode())),
+            param(lambda: memoryview(SRC.encode())),
+        ]
+    )
+    def test_sources(self, make_source):
+        expected = parse_ranges(SRC, upper=1000)
+        for chunk_size in (1, 2, 3, 7, 1 << 20):
+            assert expected == parse_stream(
+                make_source(), upper=1000, chunk_size=chunk_size
+            )
+
+    def test_mmap(self, tmp_path):
+        path = tmp_path / "ranges.txt"
+        path.write_text(SRC)
+        with path.open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as m:
+            assert parse_ranges(SRC, upper=1000) == parse_stream(
+                m, upper=1000, chunk_size=4
+            )
+
+    def test_multibyte_characters_across_chunks(self):
+        # an ideographic space is stripped as a whitespace
+        src = "1-3,　 5".encode()
+        assert [(1, 4), (5, 6)] == parse_stream(src, chunk_size=1)
+
+    def test_error_position(self):
+        with pytest.raises(ParseError) as e:
+            [*scan_stream(io.StringIO("1-3, 8-10, 20-a"), chunk_size=4)]
+        assert 14 == e.value.position